@@ -20,7 +20,7 @@ call build_venv\Scripts\activate.bat
 
 echo [2/4] Installing dependencies...
 pip install --upgrade pip
-pip install PyMuPDF Pillow pyinstaller
+pip install PyMuPDF pyarrow rapidfuzz orjson pyinstaller
 
 echo [3/4] Building executable...
 pyinstaller pdf_generator.spec --clean
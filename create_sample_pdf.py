@@ -3,72 +3,58 @@
 import fitz
 
 
+# Cached font object shared by all text appends, created on first use
+_HELV = None
+
+# Text colors
+_NAVY = (0.2, 0.3, 0.5)
+_BLACK = (0, 0, 0)
+_GREY = (0.5, 0.5, 0.5)
+_LINE_GREY = (0.7, 0.7, 0.7)
+
+# Sample content: (position, text, font size, color)
+_SAMPLE_LINES = [
+    ((72, 100), "Certificate of Completion", 24, _NAVY),
+    ((72, 150), "This certificate is awarded to:", 14, _BLACK),
+    # Space for name placeholder (around y=180)
+    ((72, 220), "For successfully completing the training program.", 12, _BLACK),
+    # Space for company placeholder (around y=260, after "Company:")
+    ((72, 260), "Company:", 12, _BLACK),
+    # Space for email placeholder (around y=300, after "Contact Email:")
+    ((72, 300), "Contact Email:", 12, _BLACK),
+    ((72, 350), "Date: February 2026", 10, _GREY),
+]
+
+
 def create_sample_pdf(output_path: str = "test_data/sample.pdf"):
     """Create a simple sample PDF for testing placeholders."""
+    global _HELV
+    if _HELV is None:
+        _HELV = fitz.Font("helv")
+
     # Create document
     doc = fitz.open()
-    
+
     # Add page
     page = doc.new_page(width=612, height=792)  # Letter size
-    
-    # Add some content
-    page.insert_text(
-        point=(72, 100),
-        text="Certificate of Completion",
-        fontsize=24,
-        fontname="helv",
-        color=(0.2, 0.3, 0.5)
-    )
-    
-    page.insert_text(
-        point=(72, 150),
-        text="This certificate is awarded to:",
-        fontsize=14,
-        fontname="helv",
-        color=(0, 0, 0)
-    )
-    
-    # Space for name placeholder (around y=180)
-    
-    page.insert_text(
-        point=(72, 220),
-        text="For successfully completing the training program.",
-        fontsize=12,
-        fontname="helv",
-        color=(0, 0, 0)
-    )
-    
-    page.insert_text(
-        point=(72, 260),
-        text="Company:",
-        fontsize=12,
-        fontname="helv",
-        color=(0, 0, 0)
-    )
-    
-    # Space for company placeholder (around y=260, after "Company:")
-    
-    page.insert_text(
-        point=(72, 300),
-        text="Contact Email:",
-        fontsize=12,
-        fontname="helv",
-        color=(0, 0, 0)
-    )
-    
-    # Space for email placeholder (around y=300, after "Contact Email:")
-    
+
+    # Batch text into one TextWriter per color, written once each
+    writers: dict[tuple, fitz.TextWriter] = {}
+    for point, text, fontsize, color in _SAMPLE_LINES:
+        tw = writers.get(color)
+        if tw is None:
+            tw = writers[color] = fitz.TextWriter(page.rect, color=color)
+        tw.append(point, text, font=_HELV, fontsize=fontsize)
+
+    for tw in writers.values():
+        tw.write_text(page)
+
     # Add a decorative line
-    page.draw_line((72, 320), (540, 320), color=(0.7, 0.7, 0.7), width=1)
-    
-    page.insert_text(
-        point=(72, 350),
-        text="Date: February 2026",
-        fontsize=10,
-        fontname="helv",
-        color=(0.5, 0.5, 0.5)
-    )
-    
+    shape = page.new_shape()
+    shape.draw_line((72, 320), (540, 320))
+    shape.finish(color=_LINE_GREY, width=1)
+    shape.commit()
+
     # Save
     doc.save(output_path)
     doc.close()
@@ -1,16 +1,20 @@
 """PDF Template Generator - Main entry point."""
 
 import sys
+import multiprocessing
 import tkinter as tk
-from src.app import PDFTemplateApp
 
 
 def main():
     """Initialize and run the application."""
+    from src.app import PDFTemplateApp
+
     root = tk.Tk()
     app = PDFTemplateApp(root)
     root.mainloop()
 
 
 if __name__ == "__main__":
+    # Required for the generation process pool in frozen Windows builds
+    multiprocessing.freeze_support()
     main()
@@ -12,12 +12,20 @@ block_cipher = None
 # Collect all pymupdf submodules
 hiddenimports = collect_submodules('fitz')
 
+# Optional accelerators, imported lazily or inside try/except; listed so the
+# frozen app keeps them when they are installed in the build environment
+hiddenimports += [
+    'pyarrow', 'pyarrow.csv', 'pyarrow.feather',
+    'rapidfuzz', 'rapidfuzz.fuzz', 'rapidfuzz.process',
+    'orjson',
+]
+
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=hiddenimports + ['PIL', 'PIL._tkinter_finder'],
+    hiddenimports=hiddenimports,
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
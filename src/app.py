@@ -3,14 +3,19 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
-from .pdf_viewer import PDFViewer
+from typing import Optional
 from .placeholder import PlaceholderManager, Placeholder
 from .template import Template
 from .csv_handler import CSVHandler
-from .pdf_generator import PDFGenerator, FONT_DISPLAY_NAMES
-from .dialogs.placeholder_dialog import PlaceholderDialog
-from .dialogs.csv_mapping_dialog import CSVMappingDialog
-from .dialogs.inline_editor import InlineEditor
+
+# Worker queue polling interval (ms): fast while messages arrive, backing off when idle
+POLL_MIN_MS = 16
+POLL_MAX_MS = 200
+
+
+def _next_poll_delay(delay: int, got_messages: bool) -> int:
+    """Return the delay before the next queue poll."""
+    return POLL_MIN_MS if got_messages else min(delay * 2, POLL_MAX_MS)
 
 
 class PDFTemplateApp:
@@ -29,6 +34,17 @@ class PDFTemplateApp:
         self.template = Template()
         self.csv_handler = CSVHandler()
         self.current_pdf_path: str = None
+        self._list_cache: list[str] = []  # Mirrors placeholder listbox rows
+        self._status_text = ""
+        self._status_pending = False
+        self._generator_cache = None  # (pdf_path, mtime, PDFGenerator)
+        self._select_after_id = None
+        self._loaded_pdf_key = None  # (path, mtime) of the PDF in the viewer
+        self._generating = False
+        self._csv_loading = False
+        self._mapping_dialog = None
+        self._placeholder_dialog = None
+        self._pending_index: Optional[int] = None
 
         # Create UI
         self._create_menu()
@@ -93,19 +109,34 @@ class PDFTemplateApp:
         main_container = tk.Frame(self.root, bg="#1e1e1e")
         main_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        # Left panel: PDF Viewer with all callbacks
-        self.pdf_viewer = PDFViewer(
-            main_container,
-            self.template.placeholder_manager,
-            on_click=self._on_pdf_click,
-            on_placeholder_select=self._on_placeholder_select,
-            on_placeholder_move=self._on_placeholder_moved,
-        )
-        self.pdf_viewer.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Left panel: container for the PDF viewer, created on first load
+        self.viewer_container = tk.Frame(main_container, bg="#1e1e1e")
+        self.viewer_container.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.pdf_viewer = None
 
         # Right panel: Sidebar
         self._create_sidebar(main_container)
 
+    def _ensure_pdf_viewer(self):
+        """Create the PDF viewer with all callbacks if it does not exist yet."""
+        if self.pdf_viewer is None:
+            from .pdf_viewer import PDFViewer
+
+            self.pdf_viewer = PDFViewer(
+                self.viewer_container,
+                self.template.placeholder_manager,
+                on_click=self._on_pdf_click,
+                on_placeholder_select=self._on_placeholder_select,
+                on_placeholder_move=self._on_placeholder_moved,
+            )
+            self.pdf_viewer.pack(fill=tk.BOTH, expand=True)
+        return self.pdf_viewer
+
+    def _refresh_viewer(self) -> None:
+        """Redraw the PDF viewer if one has been created."""
+        if self.pdf_viewer is not None:
+            self.pdf_viewer.refresh()
+
     def _create_sidebar(self, parent: tk.Widget) -> None:
         """Create the right sidebar with placeholder list and controls."""
         # Outer sidebar container
@@ -179,6 +210,8 @@ class PDFTemplateApp:
         self.instruction_label.pack(fill=tk.X, pady=5)
 
         # Inline editor (hidden by default)
+        from .dialogs.inline_editor import InlineEditor
+
         self.inline_editor = InlineEditor(
             sidebar,
             on_change=self._on_inline_editor_change,
@@ -189,9 +222,11 @@ class PDFTemplateApp:
         list_frame = tk.Frame(sidebar, bg="#3c3c3c")
         list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        # Listbox with scrollbar
+        # Listbox with scrollbar, rows backed by a single Tcl list variable
+        self._list_var = tk.StringVar(value=())
         self.placeholder_listbox = tk.Listbox(
             list_frame,
+            listvariable=self._list_var,
             bg="#3c3c3c",
             fg="white",
             selectbackground="#4a9eff",
@@ -234,14 +269,24 @@ class PDFTemplateApp:
             font=("Arial", 12, "bold"),
         ).pack(fill=tk.X)
 
+        self.csv_text_var = tk.StringVar(value="No CSV loaded")
         self.csv_label = tk.Label(
-            sidebar, text="No CSV loaded", bg="#2b2b2b", fg="#888888", font=("Arial", 9)
+            sidebar,
+            textvariable=self.csv_text_var,
+            bg="#2b2b2b",
+            fg="#888888",
+            font=("Arial", 9),
         )
         self.csv_label.pack(fill=tk.X, pady=5)
 
         # Mapping status label
+        self.mapping_var = tk.StringVar(value="")
         self.mapping_label = tk.Label(
-            sidebar, text="", bg="#2b2b2b", fg="#4a9eff", font=("Arial", 9)
+            sidebar,
+            textvariable=self.mapping_var,
+            bg="#2b2b2b",
+            fg="#4a9eff",
+            font=("Arial", 9),
         )
         self.mapping_label.pack(fill=tk.X)
 
@@ -388,9 +433,10 @@ class PDFTemplateApp:
 
     def _create_status_bar(self) -> None:
         """Create the status bar."""
+        self.status_var = tk.StringVar(value="Ready - Open a PDF to start")
         self.status_bar = tk.Label(
             self.root,
-            text="Ready - Open a PDF to start",
+            textvariable=self.status_var,
             bg="#1e1e1e",
             fg="#888888",
             anchor=tk.W,
@@ -400,25 +446,65 @@ class PDFTemplateApp:
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
     def _set_status(self, message: str) -> None:
-        """Update status bar message."""
-        self.status_bar.config(text=message)
-        self.root.update_idletasks()
+        """Update status bar message, coalescing rapid updates into one redraw."""
+        self._status_text = message
+        if not self._status_pending:
+            self._status_pending = True
+            self.root.after(50, self._flush_status)
+
+    def _flush_status(self) -> None:
+        """Apply the most recent pending status message."""
+        self._status_pending = False
+        self.status_var.set(self._status_text)
+
+    def _format_placeholder_row(self, placeholder: Placeholder) -> str:
+        """Return the listbox text for a placeholder."""
+        return f"{placeholder.get_display_name()} (pg {placeholder.page + 1})"
 
     def _update_placeholder_list(self) -> None:
-        """Update the placeholder listbox."""
-        self.placeholder_listbox.delete(0, tk.END)
+        """Rebuild the placeholder listbox from scratch."""
+        self._list_cache = [
+            self._format_placeholder_row(p)
+            for p in self.template.placeholder_manager.placeholders
+        ]
+        self._list_var.set(tuple(self._list_cache))
+
+    def _append_placeholder_row(self, placeholder: Placeholder) -> None:
+        """Add a listbox row for a newly added placeholder."""
+        display = self._format_placeholder_row(placeholder)
+        self._list_cache.append(display)
+        self.placeholder_listbox.insert(tk.END, display)
+
+    def _update_placeholder_row(self, placeholder: Placeholder) -> None:
+        """Refresh the listbox row of a single placeholder if its text changed."""
+        index = self.template.placeholder_manager.index_of(placeholder)
+        if index is None:
+            return
+
+        display = self._format_placeholder_row(placeholder)
+        if index < len(self._list_cache) and self._list_cache[index] == display:
+            return
+
+        selected = self.placeholder_listbox.selection_includes(index)
+        self.placeholder_listbox.delete(index)
+        self.placeholder_listbox.insert(index, display)
+        self._list_cache[index] = display
+        if selected:
+            self.placeholder_listbox.selection_set(index)
 
-        for p in self.template.placeholder_manager.placeholders:
-            display = f"{p.get_display_name()} (pg {p.page + 1})"
-            self.placeholder_listbox.insert(tk.END, display)
+    def _remove_placeholder_row(self, index: int) -> None:
+        """Remove the listbox row at the given index."""
+        self.placeholder_listbox.delete(index)
+        del self._list_cache[index]
 
     def _update_mapping_label(self) -> None:
         """Update the mapping status label."""
-        if self.csv_handler.mapping:
-            count = len(self.csv_handler.mapping)
-            self.mapping_label.config(text=f"✓ {count} column(s) mapped")
+        mapping = self.csv_handler.mapping_view()
+        if mapping:
+            count = len(mapping)
+            self.mapping_var.set(f"✓ {count} column(s) mapped")
         else:
-            self.mapping_label.config(text="")
+            self.mapping_var.set("")
 
     # File operations
     def _open_pdf(self) -> None:
@@ -430,12 +516,24 @@ class PDFTemplateApp:
         if path:
             self.current_pdf_path = path
             self.template.pdf_path = path
+            self._generator_cache = None
             self.template.placeholder_manager.clear()
             self.inline_editor.hide()
-            self.pdf_viewer.load_pdf(path)
+            self._show_pdf(path)
             self._update_placeholder_list()
             self._set_status(f"Opened: {os.path.basename(path)}")
 
+    def _show_pdf(self, path: str) -> None:
+        """Show a PDF in the viewer, skipping re-parsing if it is already loaded."""
+        key = (path, os.path.getmtime(path))
+        viewer = self._ensure_pdf_viewer()
+        if key == self._loaded_pdf_key:
+            viewer.selected_placeholder = None
+            viewer.refresh()
+        else:
+            viewer.load_pdf(path)
+            self._loaded_pdf_key = key
+
     def _save_template(self) -> None:
         """Save the current template."""
         if not self.template.pdf_path:
@@ -464,11 +562,12 @@ class PDFTemplateApp:
         if path:
             try:
                 self.template.load(path)
+                self._generator_cache = None
 
                 if self.template.is_valid():
                     self.current_pdf_path = self.template.pdf_path
                     self.inline_editor.hide()
-                    self.pdf_viewer.load_pdf(self.template.pdf_path)
+                    self._show_pdf(self.template.pdf_path)
                     self._update_placeholder_list()
                     self._set_status(f"Template loaded: {os.path.basename(path)}")
                 else:
@@ -482,8 +581,14 @@ class PDFTemplateApp:
     # Placeholder operations
     def _on_pdf_click(self, page: int, x: float, y: float) -> None:
         """Handle click on empty PDF area to add placeholder."""
-        # Use simple dialog for new placeholder name
-        dialog = PlaceholderDialog(self.root, page, x, y)
+        from .dialogs.placeholder_dialog import PlaceholderDialog
+
+        # Use simple dialog for new placeholder name, reused across clicks
+        dialog = self._placeholder_dialog
+        if dialog is None or not dialog.winfo_exists():
+            dialog = self._placeholder_dialog = PlaceholderDialog(self.root, page, x, y)
+        else:
+            dialog.reset(page, x, y)
         result = dialog.show()
 
         if result and result != "DELETE":
@@ -497,8 +602,8 @@ class PDFTemplateApp:
                 return
 
             self.template.placeholder_manager.add(result)
-            self._update_placeholder_list()
-            self.pdf_viewer.refresh()
+            self._append_placeholder_row(result)
+            self._refresh_viewer()
             self._set_status(f"Added placeholder: {result.get_display_name()}")
 
             # Show inline editor for the new placeholder
@@ -509,28 +614,40 @@ class PDFTemplateApp:
         self.inline_editor.show(placeholder)
 
         # Also select in listbox
-        try:
-            index = self.template.placeholder_manager.placeholders.index(placeholder)
+        index = self.template.placeholder_manager.index_of(placeholder)
+        if index is not None:
             self.placeholder_listbox.selection_clear(0, tk.END)
             self.placeholder_listbox.selection_set(index)
             self.placeholder_listbox.see(index)
-        except ValueError:
-            pass
 
     def _on_listbox_select(self, event) -> None:
-        """Handle listbox selection."""
+        """Handle listbox selection, deferring the redraw until selection settles."""
         selection = self.placeholder_listbox.curselection()
         if selection:
-            index = selection[0]
-            placeholder = self.template.placeholder_manager.placeholders[index]
-            self.inline_editor.show(placeholder)
+            self._pending_index = selection[0]
+            if self._select_after_id is not None:
+                self.root.after_cancel(self._select_after_id)
+            self._select_after_id = self.root.after(
+                30, self._commit_listbox_selection
+            )
+
+    def _commit_listbox_selection(self) -> None:
+        """Show and highlight the most recently selected placeholder."""
+        self._select_after_id = None
+        placeholders = self.template.placeholder_manager.placeholders
+        if self._pending_index is None or self._pending_index >= len(placeholders):
+            return
+
+        placeholder = placeholders[self._pending_index]
+        self.inline_editor.show(placeholder)
+        if self.pdf_viewer is not None:
             self.pdf_viewer.highlight_placeholder(placeholder)
 
     def _on_placeholder_moved(
         self, placeholder: Placeholder, new_x: float, new_y: float
     ) -> None:
         """Handle placeholder drag move."""
-        self._update_placeholder_list()
+        self._update_placeholder_row(placeholder)
 
         # Update inline editor if showing this placeholder
         if self.inline_editor.current_placeholder == placeholder:
@@ -538,14 +655,17 @@ class PDFTemplateApp:
 
     def _on_inline_editor_change(self, placeholder: Placeholder) -> None:
         """Handle live changes from inline editor."""
-        self._update_placeholder_list()
-        self.pdf_viewer.refresh()
+        self.template.placeholder_manager.invalidate_names()
+        self._update_placeholder_row(placeholder)
+        self._refresh_viewer()
 
     def _on_inline_editor_delete(self, placeholder: Placeholder) -> None:
         """Handle delete from inline editor."""
+        index = self.template.placeholder_manager.index_of(placeholder)
+        if index is not None:
+            self._remove_placeholder_row(index)
         self.template.placeholder_manager.remove(placeholder)
-        self._update_placeholder_list()
-        self.pdf_viewer.refresh()
+        self._refresh_viewer()
         self._set_status(f"Deleted placeholder")
 
     def _clear_placeholders(self) -> None:
@@ -555,7 +675,7 @@ class PDFTemplateApp:
                 self.template.placeholder_manager.clear()
                 self.inline_editor.hide()
                 self._update_placeholder_list()
-                self.pdf_viewer.refresh()
+                self._refresh_viewer()
 
     # CSV operations
     def _import_csv(self) -> None:
@@ -564,24 +684,71 @@ class PDFTemplateApp:
             title="Import CSV", filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
         )
 
-        if path:
-            try:
-                self.csv_handler.load(path)
-                self.csv_label.config(
-                    text=f"{os.path.basename(path)}\n{self.csv_handler.get_row_count()} rows, {len(self.csv_handler.headers)} columns"
-                )
-                self._set_status(f"Imported CSV: {os.path.basename(path)}")
+        if not path or self._csv_loading:
+            return
 
-                # Auto-open mapping dialog if placeholders exist
-                if self.template.placeholder_manager.placeholders:
-                    self._configure_mapping()
+        # Parse on a worker thread; only the poller touches Tk widgets
+        import queue
+
+        load_queue: queue.Queue = queue.Queue()
+        name = os.path.basename(path)
+
+        def poll(delay=POLL_MIN_MS):
+            rows = None
+            parsed = None
+            error = None
+            done = False
+            got_messages = False
+            while True:
+                try:
+                    message = load_queue.get_nowait()
+                except queue.Empty:
+                    break
+                got_messages = True
+                if message[0] == "progress":
+                    rows = message[1]
+                else:
+                    done, parsed, error = True, message[1], message[2]
 
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to import CSV: {e}")
+            if not done:
+                if rows is not None:
+                    self._set_status(f"Loading CSV: {name} ({rows} rows)...")
+                delay = _next_poll_delay(delay, got_messages)
+                self.root.after(delay, poll, delay)
+                return
+
+            self._csv_loading = False
+            self.generate_btn.config(state=tk.NORMAL)
+            if error is not None:
+                messagebox.showerror("Error", f"Failed to import CSV: {error}")
+                return
+
+            # Swap the data in on the Tk thread, where it is read
+            self.csv_handler.apply_parsed(parsed)
+            self.csv_text_var.set(
+                f"{name}\n{self.csv_handler.get_row_count()} rows, {len(self.csv_handler.headers_view())} columns"
+            )
+            self._set_status(f"Imported CSV: {name}")
+
+            # Auto-open mapping dialog if placeholders exist
+            if self.template.placeholder_manager.placeholders:
+                self._configure_mapping()
+
+        self._csv_loading = True
+        # Rows can't be generated until the new data is applied
+        self.generate_btn.config(state=tk.DISABLED)
+        self._set_status(f"Loading CSV: {name}...")
+        self.csv_handler.load_async(
+            path,
+            on_progress=lambda rows: load_queue.put(("progress", rows)),
+            on_done=lambda parsed, error: load_queue.put(("done", parsed, error)),
+        )
+        self.root.after(POLL_MIN_MS, poll)
 
     def _configure_mapping(self) -> None:
         """Open CSV mapping dialog."""
-        if not self.csv_handler.headers:
+        headers = self.csv_handler.headers_view()
+        if not headers:
             messagebox.showwarning("No CSV", "Please import a CSV file first.")
             return
 
@@ -592,9 +759,17 @@ class PDFTemplateApp:
             )
             return
 
-        dialog = CSVMappingDialog(
-            self.root, self.csv_handler.headers, placeholder_names
-        )
+        from .dialogs.csv_mapping_dialog import CSVMappingDialog
+
+        # Reuse the hidden dialog (and its row widgets) across openings
+        header_lookup = self.csv_handler.get_normalized_headers()
+        dialog = self._mapping_dialog
+        if dialog is None or not dialog.winfo_exists():
+            dialog = self._mapping_dialog = CSVMappingDialog(
+                self.root, headers, placeholder_names, header_lookup
+            )
+        else:
+            dialog.reopen(headers, placeholder_names, header_lookup)
         result = dialog.show()
 
         if result is not None:
@@ -606,6 +781,25 @@ class PDFTemplateApp:
                 self._set_status("No columns mapped")
 
     # PDF Generation
+    def _get_generator(self):
+        """Return a PDFGenerator for the template, reusing it while the PDF is unchanged."""
+        from .pdf_generator import PDFGenerator
+
+        path = self.template.pdf_path
+        mtime = os.path.getmtime(path)
+        if self._generator_cache is not None:
+            cached_path, cached_mtime, generator = self._generator_cache
+            if cached_path == path and cached_mtime == mtime:
+                return generator
+
+        generator = PDFGenerator(
+            path,
+            self.template.placeholder_manager,
+            self.csv_handler,
+        )
+        self._generator_cache = (path, mtime, generator)
+        return generator
+
     def _preview_pdf(self) -> None:
         """Generate a preview PDF with placeholder names."""
         if not self.template.pdf_path:
@@ -628,24 +822,53 @@ class PDFTemplateApp:
             return
 
         try:
-            generator = PDFGenerator(
-                self.template.pdf_path,
-                self.template.placeholder_manager,
-                self.csv_handler,
-            )
+            generator = self._get_generator()
             generator.generate_preview(output_path)
             self._set_status(f"Preview saved: {os.path.basename(output_path)}")
 
             # Ask if user wants to open it
             if messagebox.askyesno("Preview Created", "Open the preview PDF?"):
-                import subprocess
-
-                subprocess.Popen(["xdg-open", output_path])
+                self._open_file(output_path)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create preview: {e}")
 
+    @staticmethod
+    def _parse_range(
+        start_str: str, end_str: str, total: int
+    ) -> tuple[int, Optional[int]]:
+        """Parse the 1-indexed row range entries into (0-indexed start, end or None)."""
+        start_str = start_str.strip()
+        end_str = end_str.strip()
+        start = int(start_str) if start_str.isdecimal() else 1
+        end = int(end_str) if end_str.isdecimal() else None
+        return min(max(start - 1, 0), total), end
+
+    @staticmethod
+    def _open_file(path: str) -> None:
+        """Open a file with the platform's default viewer."""
+        import sys
+
+        if sys.platform == "win32":
+            os.startfile(path)
+        elif sys.platform == "darwin":
+            import subprocess
+
+            subprocess.Popen(["open", path])
+        else:
+            import webbrowser
+            from pathlib import Path
+
+            webbrowser.open(Path(path).resolve().as_uri())
+
     def _generate_pdfs(self) -> None:
         """Generate PDFs for CSV rows."""
+        if self._generating:
+            return
+        if self._csv_loading:
+            # Still reachable from the menu and Ctrl+G while the button is disabled
+            self._set_status("CSV still loading - try again when the import finishes")
+            return
+
         # Validate
         if not self.template.pdf_path:
             messagebox.showwarning("No PDF", "Please open a PDF first.")
@@ -655,7 +878,7 @@ class PDFTemplateApp:
             messagebox.showwarning("No Placeholders", "Please add placeholders first.")
             return
 
-        if not self.csv_handler.rows:
+        if not self.csv_handler.get_row_count():
             messagebox.showwarning("No CSV Data", "Please import a CSV file first.")
             return
 
@@ -666,22 +889,10 @@ class PDFTemplateApp:
             self._auto_map_columns()
 
         # Get row range
-        try:
-            start_row = int(self.start_row_var.get()) - 1  # Convert to 0-indexed
-            start_row = max(0, start_row)
-        except ValueError:
-            start_row = 0
-
-        end_row_str = self.end_row_var.get().strip()
-        if end_row_str:
-            try:
-                end_row = int(
-                    end_row_str
-                )  # Keep as 1-indexed for user, convert in generator
-            except ValueError:
-                end_row = None
-        else:
-            end_row = None
+        total_rows = self.csv_handler.get_row_count()
+        start_row, end_row = self._parse_range(
+            self.start_row_var.get(), self.end_row_var.get(), total_rows
+        )
 
         # Get output directory
         output_dir = filedialog.askdirectory(title="Select Output Directory")
@@ -694,9 +905,14 @@ class PDFTemplateApp:
             pattern = "output_{index}.pdf"
 
         # Calculate how many PDFs
-        total_rows = self.csv_handler.get_row_count()
         actual_end = total_rows if end_row is None else min(end_row, total_rows)
-        count = actual_end - start_row
+        count = max(0, actual_end - start_row)
+
+        try:
+            generator = self._get_generator()
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to generate PDFs: {e}")
+            return
 
         # Create progress window
         progress_window = tk.Toplevel(self.root)
@@ -704,8 +920,12 @@ class PDFTemplateApp:
         progress_window.geometry("400x150")
         progress_window.configure(bg="#2b2b2b")
         progress_window.transient(self.root)
-        progress_window.update_idletasks()
-        progress_window.grab_set()
+        # Closing is disabled while the worker thread is still writing files
+        progress_window.protocol("WM_DELETE_WINDOW", lambda: None)
+        # Grab once Tk gets to its idle work, instead of forcing a layout pass now
+        progress_window.after_idle(
+            lambda: progress_window.winfo_exists() and progress_window.grab_set()
+        )
 
         tk.Label(
             progress_window,
@@ -726,80 +946,95 @@ class PDFTemplateApp:
         )
         progress_label.pack()
 
-        def update_progress(current: int, total: int):
-            progress_var.set(current)
-            progress_label.config(text=f"{current} / {total}")
-            progress_window.update()
+        # When merging, rows go straight into one document without per-row files
+        merge_mode = self.merge_var.get()
+        merged_path = os.path.join(output_dir, "merged_output.pdf")
 
-        try:
-            generator = PDFGenerator(
-                self.template.pdf_path,
-                self.template.placeholder_manager,
-                self.csv_handler,
-            )
+        # Generation runs on a worker thread; only the poller touches Tk widgets
+        import queue
 
-            # If merging, use a temp directory for individual files
-            merge_mode = self.merge_var.get()
-            if merge_mode:
-                import tempfile
-                import shutil
+        gen_queue: queue.Queue = queue.Queue()
 
-                temp_dir = tempfile.mkdtemp(prefix="pdf_gen_")
-                gen_output_dir = temp_dir
+        def on_done(generated_count, error):
+            if error is not None:
+                gen_queue.put(("error", error))
             else:
-                gen_output_dir = output_dir
-
-            generated = generator.generate_batch(
-                gen_output_dir,
-                pattern,
-                progress_callback=update_progress,
-                start_row=start_row,
-                end_row=end_row,
-            )
-
-            # Merge if requested
-            if merge_mode and len(generated) >= 1:
-                progress_label.config(text="Merging PDFs...")
-                progress_window.update()
-
-                merged_path = os.path.join(output_dir, "merged_output.pdf")
-                generator.merge_pdfs(generated, merged_path)
+                gen_queue.put(("done", generated_count))
+
+        def poll(delay=POLL_MIN_MS):
+            progress = None
+            result = None
+            got_messages = False
+            while True:
+                try:
+                    message = gen_queue.get_nowait()
+                except queue.Empty:
+                    break
+                got_messages = True
+                if message[0] == "progress":
+                    # Only the latest progress value needs drawing
+                    progress = message[1:]
+                else:
+                    result = message
+
+            if progress is not None:
+                current, total = progress
+                # Parallel batches count unique output files, which can be
+                # fewer than the rows when filenames repeat
+                progress_bar.config(maximum=total)
+                progress_var.set(current)
+                progress_label.config(text=f"{current} / {total}")
+
+            if result is None:
+                delay = _next_poll_delay(delay, got_messages)
+                self.root.after(delay, poll, delay)
+                return
 
-                # Clean up temp directory
-                shutil.rmtree(temp_dir, ignore_errors=True)
+            self._generating = False
+            progress_window.destroy()
 
-                progress_window.destroy()
+            if result[0] == "error":
+                messagebox.showerror("Error", f"Failed to generate PDFs: {result[1]}")
+                return
 
+            generated_count = result[1]
+            if merge_mode and generated_count >= 1:
                 messagebox.showinfo(
-                    "Complete", f"Merged {len(generated)} pages into:\n{merged_path}"
+                    "Complete", f"Merged {generated_count} pages into:\n{merged_path}"
                 )
-                self._set_status(f"Created merged PDF with {len(generated)} documents")
+                self._set_status(f"Created merged PDF with {generated_count} documents")
             else:
-                progress_window.destroy()
-
                 messagebox.showinfo(
                     "Complete",
-                    f"Successfully generated {len(generated)} PDFs in:\n{output_dir}",
+                    f"Successfully generated {generated_count} PDFs in:\n{output_dir}",
                 )
-                self._set_status(f"Generated {len(generated)} PDFs")
-
-        except Exception as e:
-            progress_window.destroy()
-            messagebox.showerror("Error", f"Failed to generate PDFs: {e}")
+                self._set_status(f"Generated {generated_count} PDFs")
+
+        self._generating = True
+        generator.generate_batch_async(
+            output_dir,
+            pattern,
+            progress_callback=lambda current, total: gen_queue.put(
+                ("progress", current, total)
+            ),
+            start_row=start_row,
+            end_row=end_row,
+            max_workers=os.cpu_count(),
+            merged_path=merged_path if merge_mode else None,
+            on_done=on_done,
+        )
+        self.root.after(POLL_MIN_MS, poll)
 
     def _auto_map_columns(self) -> None:
         """Auto-map columns by matching names."""
         mapping = {}
         placeholder_names = self.template.placeholder_manager.get_all_names()
+        headers = self.csv_handler.get_normalized_headers()
 
         for placeholder in placeholder_names:
-            for header in self.csv_handler.headers:
-                if header.lower().replace(" ", "_") == placeholder.lower():
-                    mapping[placeholder] = header
-                    break
-                elif header.lower() == placeholder.lower():
-                    mapping[placeholder] = header
-                    break
+            header = headers.get(placeholder.lower())
+            if header is not None:
+                mapping[placeholder] = header
 
         if mapping:
             self.csv_handler.set_mapping(mapping)
@@ -867,5 +1102,7 @@ TIPS:
 
     def _on_close(self) -> None:
         """Handle window close."""
-        self.pdf_viewer.close()
+        if self.pdf_viewer is not None:
+            self.pdf_viewer.close()
+        self._loaded_pdf_key = None
         self.root.destroy()
@@ -1,7 +1,57 @@
 """CSV handling and mapping functionality."""
 
 import csv
-from typing import Optional
+import hashlib
+import os
+import sys
+import threading
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional, Sequence
+
+
+# Read buffer for CSV files; large buffers cut read() calls on big files
+READ_BUFFER_SIZE = 1 << 23
+
+# Rows parsed between progress reports during a chunked load
+LOAD_CHUNK_ROWS = 10_000
+
+# Suffix of the parsed-table cache files kept in the user cache directory
+CACHE_SUFFIX = ".feather.cache"
+
+# Cache files kept before the least recently used ones are deleted
+CACHE_MAX_FILES = 32
+CACHE_MAX_BYTES = 1 << 30
+
+
+@lru_cache(maxsize=None)
+def _pyarrow():
+    """
+    Import pyarrow on first use, keeping it off the app's startup path.
+    
+    Returns:
+        (pyarrow, pyarrow.csv, pyarrow.feather), or None when pyarrow is not
+        installed and the stdlib csv parser should be used
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+        import pyarrow.feather as feather
+    except ImportError:  # Optional: fall back to the stdlib csv parser
+        return None
+    return pa, pacsv, feather
+
+
+def _user_cache_dir() -> str:
+    """Return the per-user directory for parsed-table caches."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "autopdf", "csv")
 
 
 class CSVHandler:
@@ -9,55 +59,312 @@ class CSVHandler:
     
     def __init__(self):
         self.headers: list[str] = []
-        self.rows: list[dict] = []
+        self.columns: dict[str, list[str]] = {}  # header -> values, one per row
+        self.n_rows = 0
         self.file_path: Optional[str] = None
         self.mapping: dict[str, str] = {}  # placeholder_name -> csv_header
+        self._normalized_headers: Optional[dict[str, str]] = None
+        # Mapped values resolved into a dense grid: [row_index][placeholder_index]
+        self._placeholder_names: list[str] = []
+        self._placeholder_index: dict[str, int] = {}
+        self._value_grid: list[tuple[str, ...]] = []
     
     def load(self, file_path: str) -> None:
         """Load CSV file and parse content."""
+        self._apply(file_path, *self._parse(file_path))
+    
+    def load_async(
+        self,
+        file_path: str,
+        on_progress: Optional[Callable[[int], None]] = None,
+        on_done: Optional[Callable[[Optional[tuple], Optional[Exception]], None]] = None
+    ) -> threading.Thread:
+        """
+        Parse a CSV file on a background thread.
+        
+        The worker only parses; the current data is left untouched so readers
+        on other threads never see it half replaced. Pass the parsed result to
+        apply_parsed() from the thread that owns this handler. Both callbacks
+        run on the worker thread, so GUI callers must hand them over to their
+        own event loop.
+        
+        Args:
+            file_path: CSV file to load
+            on_progress: Called with the number of rows parsed so far
+            on_done: Called with (parsed result, None) on success,
+                     or (None, the exception that stopped the load)
+        
+        Returns:
+            The started worker thread
+        """
+        def worker():
+            try:
+                parsed = (file_path, *self._parse(file_path, on_progress))
+            except Exception as e:
+                if on_done:
+                    on_done(None, e)
+                return
+            
+            if on_done:
+                on_done(parsed, None)
+        
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        return thread
+    
+    def apply_parsed(self, parsed: tuple) -> None:
+        """Replace the loaded data with a result delivered by load_async."""
+        self._apply(*parsed)
+    
+    def _apply(
+        self, file_path: str, headers: list[str], columns: dict[str, list[str]], n_rows: int
+    ) -> None:
+        """Replace the loaded data with freshly parsed content."""
         self.file_path = file_path
-        self.headers = []
-        self.rows = []
+        self.headers = headers
+        self.columns = columns
+        self.n_rows = n_rows
+        self._normalized_headers = None
+        self._resolve_mapping()
+    
+    def _parse(
+        self, file_path: str, on_progress: Optional[Callable[[int], None]] = None
+    ) -> tuple[list[str], dict[str, list[str]], int]:
+        """Parse a CSV file into (headers, columns, row count)."""
+        if _pyarrow() is not None:
+            parsed = self._parse_arrow(file_path)
+            if parsed is not None:
+                if on_progress:
+                    on_progress(parsed[2])
+                return parsed
+        
+        with self._open(file_path) as f:
+            reader = csv.reader(f, dialect="excel")
+            headers = next(reader, [])
+            col_lists: list[list[str]] = [[] for _ in headers]
+            # Per-column pools so repeated cell values share one string object
+            pools: list[dict[str, str]] = [{} for _ in headers]
+            width = len(headers)
+            padding = [""] * width
+            n_rows = 0
+            
+            while True:
+                chunk = list(islice(reader, LOAD_CHUNK_ROWS))
+                if not chunk:
+                    break
+                
+                # Skip blank lines like csv.DictReader, and pad short rows so
+                # every column stays aligned
+                rows = [
+                    row if len(row) == width else (row + padding)[:width]
+                    for row in chunk
+                    if row
+                ]
+                
+                # Transpose the chunk and extend each column in one go
+                for values, pool, cells in zip(col_lists, pools, zip(*rows)):
+                    values.extend(map(pool.setdefault, cells, cells))
+                n_rows += len(rows)
+                
+                if on_progress:
+                    on_progress(n_rows)
+        return headers, dict(zip(headers, col_lists)), n_rows
+    
+    def _parse_arrow(
+        self, file_path: str
+    ) -> Optional[tuple[list[str], dict[str, list[str]], int]]:
+        """Parse the file with pyarrow's multithreaded reader. Returns None on failure."""
+        source_path = os.path.abspath(file_path)
+        cache_path = os.path.join(
+            _user_cache_dir(),
+            hashlib.sha256(source_path.encode("utf-8")).hexdigest() + CACHE_SUFFIX,
+        )
+        # Stat before parsing so an edit made mid-parse invalidates the cache
+        st = os.stat(file_path)
+        stamp = {
+            b"source_path": source_path.encode("utf-8"),
+            b"size": str(st.st_size).encode(),
+            b"mtime_ns": str(st.st_mtime_ns).encode(),
+        }
+        table = self._read_cache(cache_path, stamp)
+        if table is None:
+            table = self._read_arrow_csv(file_path)
+            if table is None:
+                return None
+            self._write_cache(table.replace_schema_metadata(stamp), cache_path)
         
-        with open(file_path, "r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
-            self.headers = reader.fieldnames or []
-            self.rows = list(reader)
+        columns = {}
+        for name in table.column_names:
+            # Share one string object per distinct value, as the stdlib path does
+            pool: dict[str, str] = {}
+            columns[name] = [
+                pool.setdefault(value, value) for value in table.column(name).to_pylist()
+            ]
+        return table.column_names, columns, table.num_rows
+    
+    def _read_arrow_csv(self, file_path: str):
+        """Read a CSV file into an all-string Arrow table. Returns None on failure."""
+        pa, pacsv, _ = _pyarrow()
+        with self._open(file_path) as f:
+            headers = next(csv.reader(f), [])
+        
+        # Duplicate headers cannot be typed by name; leave those to the stdlib path
+        if not headers or len(set(headers)) != len(headers):
+            return None
+        
+        try:
+            # Parse straight from the mapped file pages, without a read buffer
+            with pa.memory_map(file_path, "r") as source:
+                table = pacsv.read_csv(
+                    source,
+                    read_options=pacsv.ReadOptions(block_size=1 << 22, use_threads=True),
+                    convert_options=pacsv.ConvertOptions(
+                        column_types={h: pa.string() for h in headers},
+                        strings_can_be_null=False,
+                    ),
+                )
+        except (pa.ArrowInvalid, UnicodeDecodeError):
+            # e.g. ragged rows, which the stdlib path pads instead
+            return None
+        return table
+    
+    def _read_cache(self, cache_path: str, stamp: dict[bytes, bytes]):
+        """Return the cached table if it was built from exactly this file version, else None."""
+        pa, _, feather = _pyarrow()
+        try:
+            table = feather.read_table(cache_path, memory_map=True)
+        except (OSError, pa.ArrowInvalid):
+            return None
+        # Path, size and nanosecond mtime must all match; a newer cache is not enough
+        if table.schema.metadata != stamp:
+            return None
+        try:
+            # Mark as recently used for _prune_cache
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return table
+    
+    def _write_cache(self, table, cache_path: str) -> None:
+        """Persist a parsed table so the next load can skip CSV parsing."""
+        pa, _, feather = _pyarrow()
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            feather.write_feather(table, cache_path, compression="uncompressed")
+        except (OSError, pa.ArrowInvalid):
+            # Read-only folders etc.: caching is best effort
+            return
+        self._prune_cache(os.path.dirname(cache_path))
+    
+    @staticmethod
+    def _prune_cache(cache_dir: str) -> None:
+        """Delete the least recently used cache files beyond the count and size caps."""
+        entries = []
+        try:
+            with os.scandir(cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(CACHE_SUFFIX) and entry.is_file():
+                        st = entry.stat()
+                        entries.append((st.st_mtime_ns, st.st_size, entry.path))
+        except OSError:
+            return
+        
+        # Keep the newest files that fit within both caps; the newest (just
+        # written) one is kept even when it alone exceeds the size cap
+        entries.sort(reverse=True)
+        total = 0
+        for kept, (_, size, path) in enumerate(entries):
+            total += size
+            if kept == 0 or (kept < CACHE_MAX_FILES and total <= CACHE_MAX_BYTES):
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                # e.g. still memory-mapped by another load on Windows
+                pass
+    
+    def _open(self, file_path: str):
+        """Open a CSV file for reading with a large buffer."""
+        # utf-8-sig drops the BOM Excel writes, as pyarrow does, so both parsers
+        # see the same first header
+        return open(
+            file_path, "r", encoding="utf-8-sig", newline="", buffering=READ_BUFFER_SIZE
+        )
     
     def get_headers(self) -> list[str]:
         """Return list of CSV headers."""
         return self.headers.copy()
     
+    def headers_view(self) -> Sequence[str]:
+        """Return the CSV headers without copying; callers must not mutate them."""
+        return self.headers
+    
+    def mapping_view(self) -> Mapping[str, str]:
+        """Return a read-only view of the placeholder-to-header mapping."""
+        return MappingProxyType(self.mapping)
+    
+    def get_normalized_headers(self) -> dict[str, str]:
+        """Return lookup of lowercased (and underscored) header names to headers."""
+        if self._normalized_headers is None:
+            lookup = {}
+            for header in self.headers:
+                lowered = header.lower()
+                # First header wins, matching a front-to-back scan
+                lookup.setdefault(lowered.replace(" ", "_"), header)
+                lookup.setdefault(lowered, header)
+            self._normalized_headers = lookup
+        return self._normalized_headers
+    
     def get_row_count(self) -> int:
         """Return number of data rows."""
-        return len(self.rows)
+        return self.n_rows
     
     def set_mapping(self, mapping: dict[str, str]) -> None:
         """Set the placeholder-to-header mapping."""
         self.mapping = mapping.copy()
+        self._resolve_mapping()
+    
+    def _resolve_mapping(self) -> None:
+        """Build the row-by-placeholder value grid for the current mapping."""
+        self._placeholder_names = list(self.mapping)
+        self._placeholder_index = {
+            name: i for i, name in enumerate(self._placeholder_names)
+        }
+        
+        # Unknown headers resolve to empty values
+        empty = [""] * self.n_rows
+        mapped_columns = [self.columns.get(header, empty) for header in self.mapping.values()]
+        if mapped_columns:
+            self._value_grid = list(zip(*mapped_columns))
+        else:
+            self._value_grid = [()] * self.n_rows
     
     def get_value_for_placeholder(self, row_index: int, placeholder_name: str) -> str:
         """Get the value for a placeholder from a specific row."""
-        if row_index < 0 or row_index >= len(self.rows):
+        if row_index < 0 or row_index >= self.n_rows:
             return ""
         
-        header = self.mapping.get(placeholder_name)
-        if not header:
+        index = self._placeholder_index.get(placeholder_name)
+        if index is None:
             return ""
         
-        return self.rows[row_index].get(header, "")
+        return self._value_grid[row_index][index]
     
     def get_row_data(self, row_index: int) -> dict[str, str]:
         """Get mapped data for a specific row."""
-        result = {}
-        for placeholder_name, header in self.mapping.items():
-            if row_index < len(self.rows):
-                result[placeholder_name] = self.rows[row_index].get(header, "")
-        return result
+        if row_index < 0 or row_index >= self.n_rows:
+            return {}
+        
+        return dict(zip(self._placeholder_names, self._value_grid[row_index]))
     
     def clear(self) -> None:
         """Clear all data."""
         self.headers = []
-        self.rows = []
+        self.columns = {}
+        self.n_rows = 0
         self.file_path = None
         self.mapping = {}
+        self._normalized_headers = None
+        self._placeholder_names = []
+        self._placeholder_index = {}
+        self._value_grid = []
@@ -1,5 +1,20 @@
 """Dialogs package."""
 
-from .inline_editor import InlineEditor
-from .placeholder_dialog import PlaceholderDialog
-from .csv_mapping_dialog import CSVMappingDialog
+import importlib
+
+# Dialogs are loaded on first access so importing one does not pull in all
+_DIALOG_MODULES = {
+    "InlineEditor": ".inline_editor",
+    "PlaceholderDialog": ".placeholder_dialog",
+    "CSVMappingDialog": ".csv_mapping_dialog",
+}
+
+__all__ = list(_DIALOG_MODULES)
+
+
+def __getattr__(name: str):
+    """Import dialog classes lazily."""
+    if name in _DIALOG_MODULES:
+        module = importlib.import_module(_DIALOG_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,33 @@
 """Dialog for mapping CSV headers to placeholders."""
 
 import tkinter as tk
+from functools import lru_cache
 from tkinter import ttk
 from typing import Optional
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # Optional: fuzzy matching is skipped without it
+    process = None
+
+
+# Minimum plain edit-distance ratio for a fuzzy header match. Kept strict
+# because a match is pre-selected and flows straight into generated PDFs;
+# partial-token scorers map e.g. "name" to "First Name"
+FUZZY_SCORE_CUTOFF = 90
+
+
+@lru_cache(maxsize=256)
+def _fuzzy_match(placeholder_key: str, candidates: tuple[str, ...]) -> Optional[str]:
+    """Find the closest normalized header name for a lowercased placeholder."""
+    if process is None:
+        return None
+    
+    match = process.extractOne(
+        placeholder_key, candidates, scorer=fuzz.ratio, score_cutoff=FUZZY_SCORE_CUTOFF
+    )
+    return match[0] if match else None
+
 
 class CSVMappingDialog(tk.Toplevel):
     """Dialog for mapping CSV columns to placeholders."""
@@ -12,7 +36,8 @@ class CSVMappingDialog(tk.Toplevel):
         self,
         parent: tk.Widget,
         csv_headers: list[str],
-        placeholder_names: list[str]
+        placeholder_names: list[str],
+        header_lookup: dict[str, str]
     ):
         super().__init__(parent)
         
@@ -87,54 +112,89 @@ class CSVMappingDialog(tk.Toplevel):
             lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
         )
         
-        # Create mapping rows
+        # Pooled mapping rows, reused when the dialog is reopened
+        self._rows: list[tuple[tk.Frame, tk.Label, ttk.Combobox]] = []
+        self._done_var = tk.BooleanVar(value=False)
+        
+        # Bind Escape key
+        self.bind("<Escape>", lambda e: self._on_cancel())
+        
+        self.reopen(csv_headers, placeholder_names, header_lookup)
+    
+    def reopen(
+        self,
+        csv_headers: list[str],
+        placeholder_names: list[str],
+        header_lookup: dict[str, str]
+    ) -> None:
+        """
+        Fill the dialog for new headers/placeholders, reusing existing row widgets.
+        
+        Args:
+            csv_headers: CSV headers offered in the dropdowns
+            placeholder_names: Placeholders to map, one row each
+            header_lookup: Normalized header names to headers, as returned by
+                           CSVHandler.get_normalized_headers
+        """
+        self.csv_headers = csv_headers
+        self.placeholder_names = placeholder_names
+        self.result = None
+        self.combos = {}
+        
         label_style = {"bg": "#2b2b2b", "fg": "white", "font": ("Arial", 10)}
         
         # Add "None" option to headers
         header_options = ["(Not mapped)"] + csv_headers
         
-        for i, placeholder in enumerate(placeholder_names):
+        candidates = tuple(header_lookup)
+        
+        # Grow the row pool only when more rows are needed
+        while len(self._rows) < len(placeholder_names):
             row = tk.Frame(self.mappings_frame, bg="#2b2b2b")
-            row.pack(fill=tk.X, pady=5)
             
             # Placeholder name
-            tk.Label(
-                row, text=f"{{{{{placeholder}}}}}:", width=20, anchor=tk.E, **label_style
-            ).pack(side=tk.LEFT)
+            label = tk.Label(row, width=20, anchor=tk.E, **label_style)
+            label.pack(side=tk.LEFT)
             
             # Arrow
             tk.Label(row, text="→", bg="#2b2b2b", fg="#888888").pack(side=tk.LEFT, padx=10)
             
             # CSV header dropdown
-            combo = ttk.Combobox(row, values=header_options, state="readonly", width=25)
+            combo = ttk.Combobox(row, state="readonly", width=25)
             combo.pack(side=tk.LEFT)
             
-            # Try to auto-match by name
-            matched = False
-            for header in csv_headers:
-                if header.lower().replace(" ", "_") == placeholder.lower():
-                    combo.set(header)
-                    matched = True
-                    break
-                elif header.lower() == placeholder.lower():
-                    combo.set(header)
-                    matched = True
-                    break
+            self._rows.append((row, label, combo))
+        
+        for i, (row, label, combo) in enumerate(self._rows):
+            if i >= len(placeholder_names):
+                row.pack_forget()
+                continue
             
-            if not matched:
-                combo.set("(Not mapped)")
+            placeholder = placeholder_names[i]
+            label.config(text=f"{{{{{placeholder}}}}}:")
+            combo["values"] = header_options
             
+            # Try to auto-match by name, then by similarity
+            placeholder_key = placeholder.lower()
+            match = header_lookup.get(placeholder_key)
+            if match is None:
+                match = header_lookup.get(_fuzzy_match(placeholder_key, candidates))
+            combo.set(match or "(Not mapped)")
+            
+            row.pack(fill=tk.X, pady=5)
             self.combos[placeholder] = combo
         
-        # Bind Escape key
-        self.bind("<Escape>", lambda e: self._on_cancel())
+        self._place()
+    
+    def _place(self) -> None:
+        """Size the window to its rows and center it on the parent."""
+        parent = self.master
         
         # Set window size
         self.update_idletasks()
         width = max(550, self.mappings_frame.winfo_reqwidth() + 80)
         height = min(400, self.mappings_frame.winfo_reqheight() + 120)
         height = max(250, height)
-        self.geometry(f"{width}x{height}")
         
         # Center on parent
         parent_x = parent.winfo_rootx()
@@ -154,17 +214,25 @@ class CSVMappingDialog(tk.Toplevel):
             if header and header != "(Not mapped)":
                 self.result[placeholder] = header
         
-        self.destroy()
+        self._close()
     
     def _on_cancel(self) -> None:
         """Handle Cancel button click."""
         self.result = None
-        self.destroy()
+        self._close()
+    
+    def _close(self) -> None:
+        """Hide the dialog so it can be reopened without rebuilding widgets."""
+        self.grab_release()
+        self.withdraw()
+        self._done_var.set(True)
     
     def show(self) -> Optional[dict[str, str]]:
         """Show dialog and return mapping result."""
+        self._done_var.set(False)
+        self.deiconify()
         self.wait_visibility()
         self.grab_set()
         self.focus_force()
-        self.wait_window()
+        self.wait_variable(self._done_var)
         return self.result
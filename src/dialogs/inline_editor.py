@@ -1,12 +1,18 @@
 """Inline editor widget for editing placeholders with live preview."""
 
 import tkinter as tk
+from functools import partial
 from tkinter import ttk, colorchooser
 from typing import Optional, Callable, Tuple
 from ..placeholder import (
-    Placeholder, PLACEHOLDER_TYPE_COLUMN, PLACEHOLDER_TYPE_STATIC, PLACEHOLDER_TYPE_SERIAL
+    Placeholder, PlaceholderType, color_to_hex,
+    PLACEHOLDER_TYPE_COLUMN, PLACEHOLDER_TYPE_STATIC, PLACEHOLDER_TYPE_SERIAL
 )
-from ..pdf_generator import FONT_DISPLAY_NAMES
+from ..fonts import FONT_VALUES
+
+
+# Scale from 0-255 color channels to the 0-1 range
+_INV_255 = 1 / 255
 
 
 class InlineEditor(tk.Frame):
@@ -24,8 +30,19 @@ class InlineEditor(tk.Frame):
         self.on_delete = on_delete
         self.current_placeholder: Optional[Placeholder] = None
         self._updating = False
+        self._pending_id: Optional[str] = None  # Debounced field change
+        self._last_state: Optional[tuple] = None  # Field values last applied
+        self._visible = False  # Whether the editor is currently packed
         
         self._create_ui()
+        
+        # Per-type handlers, dispatched instead of if/elif chains
+        self._type_field_appliers = {
+            PLACEHOLDER_TYPE_COLUMN: self._apply_column_fields,
+            PLACEHOLDER_TYPE_STATIC: self._apply_static_fields,
+            PLACEHOLDER_TYPE_SERIAL: self._apply_serial_fields,
+        }
+        
         self.hide()
     
     def _create_ui(self) -> None:
@@ -58,7 +75,7 @@ class InlineEditor(tk.Frame):
         type_frame.pack(fill=tk.X, pady=(0, 6))
         
         tk.Label(type_frame, text="Type:", width=6, anchor=tk.W, **label_style).pack(side=tk.LEFT)
-        self.type_var = tk.StringVar(value=PLACEHOLDER_TYPE_COLUMN)
+        self.type_var = tk.IntVar(value=PLACEHOLDER_TYPE_COLUMN)
         
         types = [
             (PLACEHOLDER_TYPE_COLUMN, "Column"),
@@ -84,7 +101,7 @@ class InlineEditor(tk.Frame):
             self.type_fields_container, textvariable=self.name_var,
             bg="#2b2b2b", fg="white", insertbackground="white", width=16
         )
-        self.name_var.trace_add("write", lambda *args: self._on_field_change())
+        self.name_var.trace_add("write", self._on_field_change)
         
         # Static text label + entry
         self.static_label = tk.Label(self.type_fields_container, text="Text:", **label_style)
@@ -93,7 +110,7 @@ class InlineEditor(tk.Frame):
             self.type_fields_container, textvariable=self.static_var,
             bg="#2b2b2b", fg="white", insertbackground="white", width=16
         )
-        self.static_var.trace_add("write", lambda *args: self._on_field_change())
+        self.static_var.trace_add("write", self._on_field_change)
         
         # Serial prefix + start
         self.prefix_label = tk.Label(self.type_fields_container, text="Prefix:", **label_style)
@@ -102,16 +119,41 @@ class InlineEditor(tk.Frame):
             self.type_fields_container, textvariable=self.serial_prefix_var,
             bg="#2b2b2b", fg="white", insertbackground="white", width=5
         )
-        self.serial_prefix_var.trace_add("write", lambda *args: self._on_field_change())
+        self.serial_prefix_var.trace_add("write", self._on_field_change)
         
         self.start_label = tk.Label(self.type_fields_container, text="Start:", **label_style)
         self.serial_start_var = tk.StringVar(value="1")
         self.serial_start_spin = tk.Spinbox(
             self.type_fields_container, from_=0, to=99999, increment=1,
             textvariable=self.serial_start_var, width=5,
-            bg="#2b2b2b", fg="white",
-            command=self._on_field_change
+            bg="#2b2b2b", fg="white"
         )
+        self.serial_start_var.trace_add("write", self._on_field_change)
+        
+        # Grid every type field once, then hide it; grid() restores the options
+        self.name_label.grid(row=0, column=0, sticky=tk.W)
+        self.name_entry.grid(row=0, column=1, columnspan=3, padx=(2, 0), sticky=tk.EW)
+        self.static_label.grid(row=0, column=0, sticky=tk.W)
+        self.static_entry.grid(row=0, column=1, columnspan=3, padx=(2, 0), sticky=tk.EW)
+        self.prefix_label.grid(row=0, column=0, sticky=tk.W)
+        self.serial_prefix_entry.grid(row=0, column=1, padx=(2, 8), sticky=tk.W)
+        self.start_label.grid(row=0, column=2, sticky=tk.W)
+        self.serial_start_spin.grid(row=0, column=3, padx=2, sticky=tk.W)
+        self.type_fields_container.columnconfigure(3, weight=1)
+        
+        # Fields shown for each placeholder type
+        self._type_field_widgets = {
+            PLACEHOLDER_TYPE_COLUMN: (self.name_label, self.name_entry),
+            PLACEHOLDER_TYPE_STATIC: (self.static_label, self.static_entry),
+            PLACEHOLDER_TYPE_SERIAL: (
+                self.prefix_label, self.serial_prefix_entry,
+                self.start_label, self.serial_start_spin,
+            ),
+        }
+        for widgets in self._type_field_widgets.values():
+            for widget in widgets:
+                widget.grid_remove()
+        self._shown_fields: tuple[tk.Widget, ...] = ()
         
         # Position controls
         pos_frame = tk.Frame(content, bg="#3a3a3a")
@@ -122,31 +164,30 @@ class InlineEditor(tk.Frame):
         self.x_spin = tk.Spinbox(
             pos_frame, from_=0, to=2000, increment=1,
             textvariable=self.x_var, width=6,
-            bg="#2b2b2b", fg="white",
-            command=self._on_field_change
+            bg="#2b2b2b", fg="white"
         )
         self.x_spin.pack(side=tk.LEFT, padx=(2, 8))
-        self.x_spin.bind("<Return>", lambda e: self._on_field_change())
+        self.x_var.trace_add("write", self._on_field_change)
         
         tk.Label(pos_frame, text="Y:", **label_style).pack(side=tk.LEFT)
         self.y_var = tk.StringVar()
         self.y_spin = tk.Spinbox(
             pos_frame, from_=0, to=2000, increment=1,
             textvariable=self.y_var, width=6,
-            bg="#2b2b2b", fg="white",
-            command=self._on_field_change
+            bg="#2b2b2b", fg="white"
         )
         self.y_spin.pack(side=tk.LEFT, padx=2)
+        self.y_var.trace_add("write", self._on_field_change)
         
         # Nudge buttons - 1px steps
         nudge_frame = tk.Frame(pos_frame, bg="#3a3a3a")
         nudge_frame.pack(side=tk.RIGHT)
         
         btn_style = {"bg": "#2b2b2b", "fg": "white", "width": 2, "font": ("Arial", 8)}
-        tk.Button(nudge_frame, text="◀", command=lambda: self._nudge(-1, 0), **btn_style).pack(side=tk.LEFT)
-        tk.Button(nudge_frame, text="▲", command=lambda: self._nudge(0, -1), **btn_style).pack(side=tk.LEFT)
-        tk.Button(nudge_frame, text="▼", command=lambda: self._nudge(0, 1), **btn_style).pack(side=tk.LEFT)
-        tk.Button(nudge_frame, text="▶", command=lambda: self._nudge(1, 0), **btn_style).pack(side=tk.LEFT)
+        tk.Button(nudge_frame, text="◀", command=partial(self._nudge, -1, 0), **btn_style).pack(side=tk.LEFT)
+        tk.Button(nudge_frame, text="▲", command=partial(self._nudge, 0, -1), **btn_style).pack(side=tk.LEFT)
+        tk.Button(nudge_frame, text="▼", command=partial(self._nudge, 0, 1), **btn_style).pack(side=tk.LEFT)
+        tk.Button(nudge_frame, text="▶", command=partial(self._nudge, 1, 0), **btn_style).pack(side=tk.LEFT)
         
         # Font and size
         font_frame = tk.Frame(content, bg="#3a3a3a")
@@ -157,22 +198,22 @@ class InlineEditor(tk.Frame):
         self.font_combo = ttk.Combobox(
             font_frame,
             textvariable=self.font_var,
-            values=list(FONT_DISPLAY_NAMES.keys()),
+            values=FONT_VALUES,
             state="readonly",
             width=8
         )
         self.font_combo.pack(side=tk.LEFT, padx=(0, 8))
-        self.font_combo.bind("<<ComboboxSelected>>", lambda e: self._on_field_change())
+        self.font_combo.bind("<<ComboboxSelected>>", self._on_field_change)
         
         tk.Label(font_frame, text="Size:", **label_style).pack(side=tk.LEFT)
         self.size_var = tk.StringVar()
         self.size_spin = tk.Spinbox(
             font_frame, from_=6, to=72, increment=1,
             textvariable=self.size_var, width=4,
-            bg="#2b2b2b", fg="white",
-            command=self._on_field_change
+            bg="#2b2b2b", fg="white"
         )
         self.size_spin.pack(side=tk.LEFT, padx=2)
+        self.size_var.trace_add("write", self._on_field_change)
         
         # Color picker
         color_frame = tk.Frame(content, bg="#3a3a3a")
@@ -204,62 +245,70 @@ class InlineEditor(tk.Frame):
         # Store color
         self.selected_color = (0, 0, 0)
     
-    def _show_type_fields(self, ptype: str) -> None:
+    def _show_type_fields(self, ptype: PlaceholderType) -> None:
         """Show the appropriate fields for the placeholder type."""
-        # Clear all widgets from container
-        for widget in self.type_fields_container.winfo_children():
-            widget.pack_forget()
-        
-        if ptype == PLACEHOLDER_TYPE_COLUMN:
-            self.name_label.pack(side=tk.LEFT)
-            self.name_entry.pack(side=tk.LEFT, padx=(2, 0), fill=tk.X, expand=True)
-        elif ptype == PLACEHOLDER_TYPE_STATIC:
-            self.static_label.pack(side=tk.LEFT)
-            self.static_entry.pack(side=tk.LEFT, padx=(2, 0), fill=tk.X, expand=True)
-        elif ptype == PLACEHOLDER_TYPE_SERIAL:
-            self.prefix_label.pack(side=tk.LEFT)
-            self.serial_prefix_entry.pack(side=tk.LEFT, padx=(2, 8))
-            self.start_label.pack(side=tk.LEFT)
-            self.serial_start_spin.pack(side=tk.LEFT, padx=2)
+        widgets = self._type_field_widgets[ptype]
+        if widgets is self._shown_fields:
+            return
+        
+        # Only touch the fields that are changing visibility
+        for widget in self._shown_fields:
+            widget.grid_remove()
+        for widget in widgets:
+            widget.grid()
+        self._shown_fields = widgets
     
     def _on_type_change(self) -> None:
         """Handle type selection change."""
-        ptype = self.type_var.get()
+        ptype = PlaceholderType(self.type_var.get())
         self._show_type_fields(ptype)
         self._on_field_change()
     
     def show(self, placeholder: Placeholder) -> None:
         """Show editor with placeholder data."""
+        self._flush_field_change()
         self._updating = True
         self.current_placeholder = placeholder
         
-        self.title_label.config(text="Edit Placeholder")
-        self.type_var.set(placeholder.placeholder_type)
-        self.name_var.set(placeholder.name)
-        self.static_var.set(placeholder.static_value)
-        self.serial_prefix_var.set(placeholder.serial_prefix)
-        self.serial_start_var.set(str(placeholder.serial_start))
-        self.x_var.set(f"{placeholder.x:.1f}")
-        self.y_var.set(f"{placeholder.y:.1f}")
-        self.font_var.set(placeholder.font_name)
-        self.size_var.set(str(int(placeholder.font_size)))
+        # Only touch variables (and their widgets) whose value actually changes
+        for var, value in (
+            (self.type_var, int(placeholder.placeholder_type)),
+            (self.name_var, placeholder.name),
+            (self.static_var, placeholder.static_value),
+            (self.serial_prefix_var, placeholder.serial_prefix),
+            (self.serial_start_var, str(placeholder.serial_start)),
+            (self.x_var, f"{placeholder.x:.1f}"),
+            (self.y_var, f"{placeholder.y:.1f}"),
+            (self.font_var, placeholder.font_name),
+            (self.size_var, str(int(placeholder.font_size))),
+        ):
+            if var.get() != value:
+                var.set(value)
         
         self.selected_color = placeholder.font_color
         color_hex = self._color_to_hex(self.selected_color)
-        self.color_btn.config(bg=color_hex)
-        self.color_label.config(text=color_hex)
+        if self.color_label.cget("text") != color_hex:
+            self.color_btn.config(bg=color_hex)
+            self.color_label.config(text=color_hex)
         
         self._updating = False
+        self._last_state = self._field_state()
         
         # Show correct fields based on type
         self._show_type_fields(placeholder.placeholder_type)
         
-        self.pack(fill=tk.X, pady=(0, 10))
+        # Repacking forces a sidebar relayout; skip it when already shown
+        if not self._visible:
+            self.pack(fill=tk.X, pady=(0, 10))
+            self._visible = True
     
     def hide(self) -> None:
         """Hide the editor."""
+        self._flush_field_change()
         self.current_placeholder = None
-        self.pack_forget()
+        if self._visible:
+            self.pack_forget()
+            self._visible = False
     
     def _nudge(self, dx: float, dy: float) -> None:
         """Move position by delta (1px steps)."""
@@ -273,53 +322,96 @@ class InlineEditor(tk.Frame):
             y = max(0, y)
             self.x_var.set(f"{x:.1f}")
             self.y_var.set(f"{y:.1f}")
-            self._on_field_change()
+            self._apply_field_change()
         except ValueError:
             pass
     
-    def _on_field_change(self) -> None:
-        """Handle any field change - update placeholder live."""
+    def _on_field_change(self, *_args) -> None:
+        """Handle any field change - coalesce bursts of edits into one update.
+        
+        Extra arguments from variable traces and event bindings are ignored.
+        """
         if self._updating or not self.current_placeholder:
             return
         
+        if self._pending_id is not None:
+            self.after_cancel(self._pending_id)
+        self._pending_id = self.after(75, self._apply_field_change)
+    
+    def _flush_field_change(self) -> None:
+        """Apply a pending debounced change right away."""
+        if self._pending_id is not None:
+            self.after_cancel(self._pending_id)
+            self._apply_field_change()
+    
+    def _field_state(self) -> tuple:
+        """Snapshot the raw editor field values."""
+        return (
+            self.type_var.get(),
+            self.name_var.get(),
+            self.static_var.get(),
+            self.serial_prefix_var.get(),
+            self.serial_start_var.get(),
+            self.x_var.get(),
+            self.y_var.get(),
+            self.font_var.get(),
+            self.size_var.get(),
+            self.selected_color,
+        )
+    
+    def _apply_field_change(self) -> None:
+        """Update placeholder live from the editor fields."""
+        self._pending_id = None
+        ph = self.current_placeholder
+        if self._updating or ph is None:
+            return
+        
+        # Nothing to apply (and nothing to redraw) if no field changed
+        state = self._field_state()
+        if state == self._last_state:
+            return
+        
         try:
-            ptype = self.type_var.get()
-            self.current_placeholder.placeholder_type = ptype
-            
-            if ptype == PLACEHOLDER_TYPE_COLUMN:
-                name = self.name_var.get().strip()
-                if name:
-                    name = name.replace("{", "").replace("}", "")
-                    self.current_placeholder.name = name
-            elif ptype == PLACEHOLDER_TYPE_STATIC:
-                self.current_placeholder.static_value = self.static_var.get()
-                self.current_placeholder.name = f"static_{id(self.current_placeholder)}"
-            elif ptype == PLACEHOLDER_TYPE_SERIAL:
-                self.current_placeholder.serial_prefix = self.serial_prefix_var.get()
-                try:
-                    self.current_placeholder.serial_start = int(self.serial_start_var.get())
-                except ValueError:
-                    self.current_placeholder.serial_start = 1
-                self.current_placeholder.name = f"serial_{id(self.current_placeholder)}"
+            ptype = PlaceholderType(self.type_var.get())
+            ph.placeholder_type = ptype
+            self._type_field_appliers[ptype](ph)
             
-            self.current_placeholder.x = float(self.x_var.get())
-            self.current_placeholder.y = float(self.y_var.get())
-            self.current_placeholder.font_name = self.font_var.get()
-            self.current_placeholder.font_size = float(self.size_var.get())
-            self.current_placeholder.font_color = self.selected_color
+            ph.x = float(self.x_var.get())
+            ph.y = float(self.y_var.get())
+            ph.font_name = self.font_var.get()
+            ph.font_size = float(self.size_var.get())
+            ph.font_color = self.selected_color
             
+            self._last_state = state
             if self.on_change:
-                self.on_change(self.current_placeholder)
+                self.on_change(ph)
         except ValueError:
             pass
     
+    def _apply_column_fields(self, ph: Placeholder) -> None:
+        """Copy the column name field to the placeholder."""
+        name = self.name_var.get().strip()
+        if name:
+            name = name.replace("{", "").replace("}", "")
+            ph.name = name
+    
+    def _apply_static_fields(self, ph: Placeholder) -> None:
+        """Copy the static text field to the placeholder."""
+        ph.static_value = self.static_var.get()
+        ph.name = f"static_{id(ph)}"
+    
+    def _apply_serial_fields(self, ph: Placeholder) -> None:
+        """Copy the serial prefix and start fields to the placeholder."""
+        ph.serial_prefix = self.serial_prefix_var.get()
+        try:
+            ph.serial_start = int(self.serial_start_var.get())
+        except ValueError:
+            ph.serial_start = 1
+        ph.name = f"serial_{id(ph)}"
+    
     def _color_to_hex(self, color: Tuple[float, ...]) -> str:
         """Convert RGB tuple to hex."""
-        if any(c > 1 for c in color):
-            r, g, b = int(color[0]), int(color[1]), int(color[2])
-        else:
-            r, g, b = int(color[0] * 255), int(color[1] * 255), int(color[2] * 255)
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return color_to_hex(color)
     
     def _pick_color(self) -> None:
         """Open color picker."""
@@ -330,7 +422,8 @@ class InlineEditor(tk.Frame):
         result = colorchooser.askcolor(color=initial, parent=self)
         
         if result[0]:
-            self.selected_color = tuple(c / 255 for c in result[0])
+            r8, g8, b8 = result[0]
+            self.selected_color = (r8 * _INV_255, g8 * _INV_255, b8 * _INV_255)
             self.color_btn.config(bg=result[1])
             self.color_label.config(text=result[1])
             self._on_field_change()
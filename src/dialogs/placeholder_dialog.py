@@ -1,10 +1,23 @@
 """Dialog for adding/editing placeholders with position controls."""
 
 import tkinter as tk
+from functools import partial
 from tkinter import ttk, colorchooser
 from typing import Optional, Tuple, Callable
-from ..placeholder import Placeholder
-from ..pdf_generator import FONT_DISPLAY_NAMES
+from ..placeholder import Placeholder, color_to_hex
+from ..fonts import FONT_VALUES
+
+
+# Scale from 0-255 color channels to the 0-1 range
+_INV_255 = 1 / 255
+
+# Arrow key -> nudge direction; Shift selects the fine step
+_ARROW_DIRECTIONS = {
+    "Up": (0, -1),
+    "Down": (0, 1),
+    "Left": (-1, 0),
+    "Right": (1, 0),
+}
 
 
 class PlaceholderDialog(tk.Toplevel):
@@ -25,12 +38,13 @@ class PlaceholderDialog(tk.Toplevel):
         self.page = page
         self.x = x
         self.y = y
-        self.selected_color = existing.font_color if existing else (0, 0, 0)
+        self.selected_color = (0, 0, 0)
         self.on_position_change = on_position_change
         self.existing = existing
+        self._pending_id: Optional[str] = None  # Debounced position change
+        self._done_var = tk.BooleanVar(value=False)
         
         # Window setup
-        self.title("Edit Placeholder" if existing else "Add Placeholder")
         self.geometry("420x480")
         self.configure(bg="#2b2b2b")
         self.resizable(False, False)
@@ -51,8 +65,6 @@ class PlaceholderDialog(tk.Toplevel):
         tk.Label(main_frame, text="Placeholder Name:", **label_style).pack(anchor=tk.W)
         self.name_entry = tk.Entry(main_frame, width=40, **entry_style)
         self.name_entry.pack(fill=tk.X, pady=(5, 10))
-        if existing:
-            self.name_entry.insert(0, existing.name)
         
         # Help text
         tk.Label(
@@ -81,30 +93,28 @@ class PlaceholderDialog(tk.Toplevel):
         x_frame.pack(side=tk.LEFT, padx=(0, 20))
         
         tk.Label(x_frame, text="X:", **label_style).pack(side=tk.LEFT)
-        self.x_var = tk.StringVar(value=f"{self.x:.1f}")
+        self.x_var = tk.StringVar()
         self.x_spin = tk.Spinbox(
             x_frame, from_=0, to=1000, increment=1,
             textvariable=self.x_var, width=8,
-            bg="#3c3c3c", fg="white",
-            command=self._on_position_spin
+            bg="#3c3c3c", fg="white"
         )
         self.x_spin.pack(side=tk.LEFT, padx=5)
-        self.x_spin.bind("<Return>", lambda e: self._on_position_spin())
+        self.x_var.trace_add("write", self._on_position_spin)
         
         # Y position
         y_frame = tk.Frame(pos_frame, bg="#2b2b2b")
         y_frame.pack(side=tk.LEFT)
         
         tk.Label(y_frame, text="Y:", **label_style).pack(side=tk.LEFT)
-        self.y_var = tk.StringVar(value=f"{self.y:.1f}")
+        self.y_var = tk.StringVar()
         self.y_spin = tk.Spinbox(
             y_frame, from_=0, to=1000, increment=1,
             textvariable=self.y_var, width=8,
-            bg="#3c3c3c", fg="white",
-            command=self._on_position_spin
+            bg="#3c3c3c", fg="white"
         )
         self.y_spin.pack(side=tk.LEFT, padx=5)
-        self.y_spin.bind("<Return>", lambda e: self._on_position_spin())
+        self.y_var.trace_add("write", self._on_position_spin)
         
         # Nudge buttons
         nudge_frame = tk.Frame(main_frame, bg="#2b2b2b")
@@ -113,11 +123,11 @@ class PlaceholderDialog(tk.Toplevel):
         btn_style = {"bg": "#3c3c3c", "fg": "white", "width": 3, "font": ("Arial", 10)}
         
         # Create arrow button layout
-        tk.Button(nudge_frame, text="▲", command=lambda: self._nudge(0, -5), **btn_style).grid(row=0, column=1)
-        tk.Button(nudge_frame, text="◀", command=lambda: self._nudge(-5, 0), **btn_style).grid(row=1, column=0)
-        tk.Button(nudge_frame, text="•", command=lambda: None, bg="#2b2b2b", fg="#2b2b2b", width=3, bd=0).grid(row=1, column=1)
-        tk.Button(nudge_frame, text="▶", command=lambda: self._nudge(5, 0), **btn_style).grid(row=1, column=2)
-        tk.Button(nudge_frame, text="▼", command=lambda: self._nudge(0, 5), **btn_style).grid(row=2, column=1)
+        tk.Button(nudge_frame, text="▲", command=partial(self._nudge, 0, -5), **btn_style).grid(row=0, column=1)
+        tk.Button(nudge_frame, text="◀", command=partial(self._nudge, -5, 0), **btn_style).grid(row=1, column=0)
+        tk.Button(nudge_frame, text="•", bg="#2b2b2b", fg="#2b2b2b", width=3, bd=0).grid(row=1, column=1)
+        tk.Button(nudge_frame, text="▶", command=partial(self._nudge, 5, 0), **btn_style).grid(row=1, column=2)
+        tk.Button(nudge_frame, text="▼", command=partial(self._nudge, 0, 5), **btn_style).grid(row=2, column=1)
         
         tk.Label(
             main_frame, text="Fine: hold Shift for 1px nudge",
@@ -133,11 +143,11 @@ class PlaceholderDialog(tk.Toplevel):
         
         tk.Label(font_frame, text="Font:", **label_style).pack(side=tk.LEFT)
         
-        self.font_var = tk.StringVar(value=existing.font_name if existing else "helv")
+        self.font_var = tk.StringVar()
         self.font_combo = ttk.Combobox(
             font_frame, 
             textvariable=self.font_var,
-            values=list(FONT_DISPLAY_NAMES.keys()),
+            values=FONT_VALUES,
             state="readonly",
             width=12
         )
@@ -146,7 +156,7 @@ class PlaceholderDialog(tk.Toplevel):
         # Size field
         tk.Label(font_frame, text="Size:", **label_style).pack(side=tk.LEFT)
         
-        self.size_var = tk.StringVar(value=str(existing.font_size if existing else 12))
+        self.size_var = tk.StringVar()
         self.size_spin = tk.Spinbox(
             font_frame,
             from_=6, to=72, increment=1,
@@ -165,7 +175,6 @@ class PlaceholderDialog(tk.Toplevel):
         self.color_btn = tk.Button(
             color_frame,
             text="     ",
-            bg=self._color_to_hex(self.selected_color),
             command=self._pick_color,
             width=5
         )
@@ -173,7 +182,6 @@ class PlaceholderDialog(tk.Toplevel):
         
         self.color_label = tk.Label(
             color_frame,
-            text=self._color_to_hex(self.selected_color),
             bg="#2b2b2b", fg="#888888"
         )
         self.color_label.pack(side=tk.LEFT, padx=(10, 0))
@@ -182,11 +190,11 @@ class PlaceholderDialog(tk.Toplevel):
         btn_frame = tk.Frame(main_frame, bg="#2b2b2b")
         btn_frame.pack(fill=tk.X, pady=(25, 0))
         
-        if existing:
-            tk.Button(
-                btn_frame, text="Delete", command=self._on_delete,
-                bg="#5a3030", fg="white", width=8
-            ).pack(side=tk.LEFT)
+        # Packed by reset() only when editing an existing placeholder
+        self.delete_btn = tk.Button(
+            btn_frame, text="Delete", command=self._on_delete,
+            bg="#5a3030", fg="white", width=8
+        )
         
         tk.Button(
             btn_frame, text="Cancel", command=self._on_cancel,
@@ -198,20 +206,59 @@ class PlaceholderDialog(tk.Toplevel):
             bg="#4a9eff", fg="white", width=10
         ).pack(side=tk.RIGHT, padx=(0, 10))
         
-        # Focus on name entry
-        self.name_entry.focus_set()
-        
         # Bind Enter key
-        self.bind("<Return>", lambda e: self._on_ok())
-        self.bind("<Escape>", lambda e: self._on_cancel())
+        self.bind("<Return>", self._on_ok)
+        self.bind("<Escape>", self._on_cancel)
         
         # Bind arrow keys for nudging
-        self.bind("<Up>", lambda e: self._nudge(0, -5 if not e.state & 1 else -1))
-        self.bind("<Down>", lambda e: self._nudge(0, 5 if not e.state & 1 else 1))
-        self.bind("<Left>", lambda e: self._nudge(-5 if not e.state & 1 else -1, 0))
-        self.bind("<Right>", lambda e: self._nudge(5 if not e.state & 1 else 1, 0))
+        for keysym in _ARROW_DIRECTIONS:
+            self.bind(f"<{keysym}>", self._on_arrow_key)
+        
+        self.reset(page, x, y, existing, on_position_change)
+    
+    def reset(
+        self,
+        page: int,
+        x: float,
+        y: float,
+        existing: Optional[Placeholder] = None,
+        on_position_change: Optional[Callable[[float, float], None]] = None
+    ) -> None:
+        """Refill the dialog for another placeholder, reusing its widgets."""
+        self.result = None
+        self.page = page
+        self.x = x
+        self.y = y
+        self.existing = existing
+        self.on_position_change = on_position_change
+        
+        self.title("Edit Placeholder" if existing else "Add Placeholder")
+        
+        self.name_entry.configure(bg="#3c3c3c")
+        self.name_entry.delete(0, tk.END)
+        if existing:
+            self.name_entry.insert(0, existing.name)
+        
+        self.x_var.set(f"{x:.1f}")
+        self.y_var.set(f"{y:.1f}")
+        self.font_var.set(existing.font_name if existing else "helv")
+        self.size_var.set(str(existing.font_size if existing else 12))
+        
+        self.selected_color = existing.font_color if existing else (0, 0, 0)
+        color_hex = self._color_to_hex(self.selected_color)
+        self.color_btn.configure(bg=color_hex)
+        self.color_label.configure(text=color_hex)
+        
+        if existing:
+            self.delete_btn.pack(side=tk.LEFT)
+        else:
+            self.delete_btn.pack_forget()
         
-        # Center on parent
+        self._place()
+    
+    def _place(self) -> None:
+        """Center the dialog on its parent."""
+        parent = self.master
         self.update_idletasks()
         parent_x = parent.winfo_rootx()
         parent_y = parent.winfo_rooty()
@@ -235,37 +282,52 @@ class PlaceholderDialog(tk.Toplevel):
         self.x_var.set(f"{self.x:.1f}")
         self.y_var.set(f"{self.y:.1f}")
         
-        if self.on_position_change:
-            self.on_position_change(self.x, self.y)
+        self._schedule_position_change()
     
-    def _on_position_spin(self) -> None:
+    def _on_arrow_key(self, event: tk.Event) -> None:
+        """Nudge by 5 points, or by 1 with Shift held."""
+        dx, dy = _ARROW_DIRECTIONS[event.keysym]
+        step = 1 if event.state & 1 else 5
+        self._nudge(dx * step, dy * step)
+    
+    def _on_position_spin(self, *_args) -> None:
         """Handle position spinbox change."""
         try:
             self.x = float(self.x_var.get())
             self.y = float(self.y_var.get())
-            if self.on_position_change:
-                self.on_position_change(self.x, self.y)
+            self._schedule_position_change()
         except ValueError:
             pass
     
+    def _schedule_position_change(self) -> None:
+        """Coalesce bursts of position changes into one preview update."""
+        if not self.on_position_change:
+            return
+        
+        if self._pending_id is not None:
+            self.after_cancel(self._pending_id)
+        self._pending_id = self.after(75, self._notify_position_change)
+    
+    def _notify_position_change(self) -> None:
+        """Report the current position to the preview."""
+        self._pending_id = None
+        self.on_position_change(self.x, self.y)
+    
     def _color_to_hex(self, color: Tuple[float, ...]) -> str:
         """Convert RGB tuple (0-1 range) to hex color."""
-        if any(c > 1 for c in color):
-            r, g, b = int(color[0]), int(color[1]), int(color[2])
-        else:
-            r, g, b = int(color[0] * 255), int(color[1] * 255), int(color[2] * 255)
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return color_to_hex(color)
     
     def _pick_color(self) -> None:
         """Open color picker dialog."""
         initial_color = self._color_to_hex(self.selected_color)
         color = colorchooser.askcolor(color=initial_color, parent=self)
         if color[0]:
-            self.selected_color = tuple(c / 255 for c in color[0])
+            r8, g8, b8 = color[0]
+            self.selected_color = (r8 * _INV_255, g8 * _INV_255, b8 * _INV_255)
             self.color_btn.configure(bg=color[1])
             self.color_label.configure(text=color[1])
     
-    def _on_ok(self) -> None:
+    def _on_ok(self, *_args) -> None:
         """Handle OK button click."""
         name = self.name_entry.get().strip()
         if not name:
@@ -297,23 +359,43 @@ class PlaceholderDialog(tk.Toplevel):
             font_color=self.selected_color
         )
         
-        self.destroy()
+        self._close()
     
-    def _on_cancel(self) -> None:
+    def _on_cancel(self, *_args) -> None:
         """Handle Cancel button click."""
         self.result = None
-        self.destroy()
+        self._close()
     
     def _on_delete(self) -> None:
         """Handle Delete button click."""
         self.result = "DELETE"  # Special marker
-        self.destroy()
+        self._close()
+    
+    def _cancel_pending(self) -> None:
+        """Drop any pending position update."""
+        if self._pending_id is not None:
+            self.after_cancel(self._pending_id)
+            self._pending_id = None
+    
+    def _close(self) -> None:
+        """Hide the dialog so it can be reopened without rebuilding widgets."""
+        self._cancel_pending()
+        self.grab_release()
+        self.withdraw()
+        self._done_var.set(True)
+    
+    def destroy(self) -> None:
+        """Cancel any pending position update before closing."""
+        self._cancel_pending()
+        super().destroy()
     
     def show(self) -> Optional[Placeholder]:
         """Show dialog and return result."""
+        self._done_var.set(False)
+        self.deiconify()
         self.wait_visibility()
         self.grab_set()
         self.focus_force()
         self.name_entry.focus_set()
-        self.wait_window()
+        self.wait_variable(self._done_var)
         return self.result
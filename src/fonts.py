@@ -0,0 +1,22 @@
+"""Built-in PDF font codes shared by the generator and the editor dialogs."""
+
+
+# Font mapping for PyMuPDF
+FONT_MAP = {
+    "helv": "helv",      # Helvetica
+    "tiro": "tiro",      # Times Roman
+    "cour": "cour",      # Courier
+    "symb": "symb",      # Symbol
+    "zadb": "zadb",      # ZapfDingbats
+}
+
+FONT_DISPLAY_NAMES = {
+    "helv": "Helvetica",
+    "tiro": "Times Roman", 
+    "cour": "Courier",
+    "symb": "Symbol",
+    "zadb": "ZapfDingbats",
+}
+
+# Font codes offered in font dropdowns, built once at import
+FONT_VALUES = tuple(FONT_DISPLAY_NAMES)
@@ -1,28 +1,173 @@
 """PDF generation engine."""
 
+import math
+import multiprocessing
 import os
+import re
+import threading
 import fitz  # PyMuPDF
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Callable, Optional
 from .placeholder import Placeholder, PlaceholderManager, PLACEHOLDER_TYPE_COLUMN
 from .csv_handler import CSVHandler
+from .fonts import FONT_MAP, FONT_DISPLAY_NAMES, FONT_VALUES  # noqa: F401 (re-exported)
 
 
-# Font mapping for PyMuPDF
-FONT_MAP = {
-    "helv": "helv",      # Helvetica
-    "tiro": "tiro",      # Times Roman
-    "cour": "cour",      # Courier
-    "symb": "symb",      # Symbol
-    "zadb": "zadb",      # ZapfDingbats
-}
+# Below this many rows the process pool startup cost outweighs the gain;
+# spawned workers each re-import fitz and re-read the template (measured
+# crossover: about 40 rows with 4 workers)
+PARALLEL_MIN_ROWS = 40
 
-FONT_DISPLAY_NAMES = {
-    "helv": "Helvetica",
-    "tiro": "Times Roman", 
-    "cour": "Courier",
-    "symb": "Symbol",
-    "zadb": "ZapfDingbats",
-}
+# Rows each worker should get at least, so small batches start fewer workers
+ROWS_PER_WORKER = 10
+
+# Pools are started from the GUI's worker thread; forking a threaded Tk
+# process is unsafe, so workers are always spawned fresh
+_POOL_CONTEXT = multiprocessing.get_context("spawn")
+
+# Document.save options for previews and intermediate row documents: skip all
+# optional work. Final outputs keep the default save()
+SCRATCH_SAVE_OPTIONS = {"garbage": 0, "deflate": False, "clean": False}
+
+# {name} tokens in an output filename pattern
+_PATTERN_TOKEN = re.compile(r"\{([^{}]+)\}")
+
+# Characters dropped from values substituted into filenames; \w is isalnum() or "_"
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w.\- ]")
+
+
+# Source PDF contents read by this process, keyed by path (see render_one_row)
+_SOURCE_BYTES_CACHE: dict[str, bytes] = {}
+
+
+# A placeholder with its insert_text arguments resolved:
+# (placeholder, point, font name, font size, 0-1 color)
+PreparedPlaceholder = tuple[Placeholder, tuple[float, float], str, float, tuple]
+
+# Prepared placeholders grouped by page: [(page_index, [prepared, ...])]
+PreparedPages = list[tuple[int, list[PreparedPlaceholder]]]
+
+
+def _pool_workers(max_workers: Optional[int], count: int) -> int:
+    """Return how many worker processes to use for count rows; 1 means sequential."""
+    if not max_workers or count < PARALLEL_MIN_ROWS:
+        return 1
+    return max(1, min(max_workers, math.ceil(count / ROWS_PER_WORKER)))
+
+
+def _prepare_placeholders(placeholders: list[Placeholder]) -> PreparedPages:
+    """Group placeholders by page and resolve their text insertion arguments once."""
+    by_page: dict[int, list[PreparedPlaceholder]] = {}
+    for placeholder in placeholders:
+        by_page.setdefault(placeholder.page, []).append((
+            placeholder,
+            (placeholder.x, placeholder.y),
+            placeholder.font_name,
+            placeholder.font_size,
+            placeholder.color01,
+        ))
+    return list(by_page.items())
+
+
+def _apply_placeholders(
+    doc: fitz.Document,
+    prepared: PreparedPages,
+    row_index: int,
+    row_data: dict
+) -> None:
+    """Write placeholder values for one row into an open document."""
+    for page_index, page_placeholders in prepared:
+        page = doc[page_index]
+        
+        for placeholder, point, fontname, fontsize, color in page_placeholders:
+            # Use the placeholder's get_value method which handles all types
+            value = placeholder.get_value(row_index, row_data)
+            if not value:
+                continue
+            
+            # Insert text at placeholder position
+            page.insert_text(
+                point, value, fontname=fontname, fontsize=fontsize, color=color
+            )
+
+
+def _build_row_doc(
+    src_bytes: bytes,
+    prepared: PreparedPages,
+    row_index: int,
+    row_data: dict
+) -> fitz.Document:
+    """Open a fresh copy of the source PDF and fill in one row."""
+    # Opening the bytes (rather than insert_pdf into a new document) keeps
+    # the title, outline and page labels of the template
+    doc = fitz.open("pdf", src_bytes)
+    _apply_placeholders(doc, prepared, row_index, row_data)
+    return doc
+
+
+def _render_row(
+    src_bytes: bytes,
+    prepared: PreparedPages,
+    row_index: int,
+    row_data: dict,
+    output_path: str
+) -> None:
+    """Fill in one row and save it to output_path."""
+    doc = _build_row_doc(src_bytes, prepared, row_index, row_data)
+    doc.save(output_path)
+    doc.close()
+
+
+def _worker_source(pdf_path: str) -> bytes:
+    """Return this process's in-memory copy of the source PDF."""
+    # Workers render many rows; read the source file once per process
+    src_bytes = _SOURCE_BYTES_CACHE.get(pdf_path)
+    if src_bytes is None:
+        with open(pdf_path, "rb") as f:
+            src_bytes = _SOURCE_BYTES_CACHE[pdf_path] = f.read()
+    return src_bytes
+
+
+def render_one_row(args: tuple) -> str:
+    """
+    Render a single output PDF in a worker process.
+    
+    Args:
+        args: Tuple of (pdf_path, placeholder_dicts, row_index, row_data, output_path),
+              all picklable so it can be submitted to a process pool
+    
+    Returns:
+        The output path that was written
+    """
+    pdf_path, placeholder_dicts, row_index, row_data, output_path = args
+    placeholders = [Placeholder.from_dict(d) for d in placeholder_dicts]
+    
+    _render_row(
+        _worker_source(pdf_path), _prepare_placeholders(placeholders),
+        row_index, row_data, output_path
+    )
+    return output_path
+
+
+def render_row_bytes(args: tuple) -> bytes:
+    """
+    Render a single row in a worker process and return the PDF as bytes.
+    
+    Args:
+        args: Tuple of (pdf_path, placeholder_dicts, row_index, row_data)
+    
+    Returns:
+        The serialized PDF, for the parent process to merge
+    """
+    pdf_path, placeholder_dicts, row_index, row_data = args
+    placeholders = [Placeholder.from_dict(d) for d in placeholder_dicts]
+    
+    doc = _build_row_doc(
+        _worker_source(pdf_path), _prepare_placeholders(placeholders), row_index, row_data
+    )
+    data = doc.tobytes(**SCRATCH_SAVE_OPTIONS)
+    doc.close()
+    return data
 
 
 class PDFGenerator:
@@ -37,37 +182,38 @@ class PDFGenerator:
         self.pdf_path = pdf_path
         self.placeholder_manager = placeholder_manager
         self.csv_handler = csv_handler
+        # Template file contents, keyed by (path, mtime) so edits are picked up
+        self._pdf_bytes: Optional[bytes] = None
+        self._pdf_bytes_key: Optional[tuple[str, float]] = None
+    
+    def _source_bytes(self) -> bytes:
+        """Return an in-memory copy of the template PDF file."""
+        key = (self.pdf_path, os.path.getmtime(self.pdf_path))
+        if key != self._pdf_bytes_key:
+            with open(self.pdf_path, "rb") as f:
+                self._pdf_bytes = f.read()
+            self._pdf_bytes_key = key
+        return self._pdf_bytes
+    
+    def _open_source(self) -> fitz.Document:
+        """Open the template PDF from an in-memory copy of the file."""
+        return fitz.open("pdf", self._source_bytes())
     
     def generate_single(self, row_index: int, output_path: str) -> None:
         """Generate a single PDF for one row of data."""
-        # Open the original PDF
-        doc = fitz.open(self.pdf_path)
-        
-        # Get data for this row
         row_data = self.csv_handler.get_row_data(row_index)
+        self.generate_single_with_data(row_index, row_data, output_path)
+    
+    def generate_single_with_data(
+        self, row_index: int, row_data: dict[str, str], output_path: str
+    ) -> None:
+        """Generate a single PDF from already-fetched row data."""
+        # Open the original PDF
+        doc = self._open_source()
         
         # Process each placeholder
-        for placeholder in self.placeholder_manager.placeholders:
-            # Use the placeholder's get_value method which handles all types
-            value = placeholder.get_value(row_index, row_data)
-            if not value:
-                continue
-            
-            page = doc[placeholder.page]
-            
-            # Convert color from 0-255 to 0-1 range if needed
-            color = placeholder.font_color
-            if any(c > 1 for c in color):
-                color = tuple(c / 255 for c in color)
-            
-            # Insert text at placeholder position
-            page.insert_text(
-                point=(placeholder.x, placeholder.y),
-                text=value,
-                fontname=placeholder.font_name,
-                fontsize=placeholder.font_size,
-                color=color
-            )
+        prepared = _prepare_placeholders(self.placeholder_manager.placeholders)
+        _apply_placeholders(doc, prepared, row_index, row_data)
         
         # Save the modified PDF
         doc.save(output_path)
@@ -75,35 +221,32 @@ class PDFGenerator:
     
     def generate_preview(self, output_path: str) -> None:
         """Generate a preview PDF with placeholder names as text (without braces)."""
-        doc = fitz.open(self.pdf_path)
+        doc = self._open_source()
         
-        for placeholder in self.placeholder_manager.placeholders:
-            # For preview, show the name without braces
-            if placeholder.placeholder_type == PLACEHOLDER_TYPE_COLUMN:
-                value = placeholder.name
-            else:
-                # For static/serial, show actual value
-                value = placeholder.get_value(0, {})
-            
-            if not value:
-                continue
+        for page_index, page_placeholders in _prepare_placeholders(
+            self.placeholder_manager.placeholders
+        ):
+            page = doc[page_index]
             
-            page = doc[placeholder.page]
-            
-            color = placeholder.font_color
-            if any(c > 1 for c in color):
-                color = tuple(c / 255 for c in color)
-            
-            page.insert_text(
-                point=(placeholder.x, placeholder.y),
-                text=value,
-                fontname=placeholder.font_name,
-                fontsize=placeholder.font_size,
-                color=color
-            )
+            for placeholder, point, fontname, fontsize, color in page_placeholders:
+                # For preview, show the name without braces
+                if placeholder.placeholder_type == PLACEHOLDER_TYPE_COLUMN:
+                    value = placeholder.name
+                else:
+                    # For static/serial, show actual value
+                    value = placeholder.get_value(0, {})
+                
+                if not value:
+                    continue
+                
+                page.insert_text(
+                    point, value, fontname=fontname, fontsize=fontsize, color=color
+                )
         
-        doc.save(output_path)
-        doc.close()
+        try:
+            doc.save(output_path, **SCRATCH_SAVE_OPTIONS)
+        finally:
+            doc.close()
     
     def generate_batch(
         self,
@@ -111,7 +254,8 @@ class PDFGenerator:
         filename_pattern: str = "output_{index}.pdf",
         progress_callback: Optional[Callable[[int, int], None]] = None,
         start_row: int = 0,
-        end_row: Optional[int] = None
+        end_row: Optional[int] = None,
+        max_workers: Optional[int] = None
     ) -> list[str]:
         """
         Generate PDFs for a range of rows in the CSV.
@@ -123,36 +267,41 @@ class PDFGenerator:
             progress_callback: Function called with (current, total) for progress updates
             start_row: First row to process (0-indexed)
             end_row: Last row to process (exclusive), None for all rows
+            max_workers: Maximum number of worker processes; None or 1 renders
+                         sequentially. Small batches always render sequentially,
+                         and at most one worker is started per ROWS_PER_WORKER rows.
         
         Returns:
             List of generated file paths
         """
         os.makedirs(output_dir, exist_ok=True)
         
-        total_rows = self.csv_handler.get_row_count()
-        
-        # Calculate range
-        start = max(0, min(start_row, total_rows))
-        end = total_rows if end_row is None else min(end_row, total_rows)
+        start, end = self._row_range(start_row, end_row)
         
         generated_files = []
         count = end - start
         
+        # Column tokens referenced by the filename pattern, found once
+        pattern_columns = self._pattern_columns(filename_pattern)
+        
+        if _pool_workers(max_workers, count) > 1:
+            return self._generate_batch_parallel(
+                output_dir, filename_pattern, pattern_columns,
+                progress_callback, start, end, max_workers
+            )
+        
+        # Read the template and resolve colors once for the whole batch
+        src_bytes = self._source_bytes()
+        prepared = _prepare_placeholders(self.placeholder_manager.placeholders)
+        
         for idx, i in enumerate(range(start, end)):
-            # Generate filename
-            filename = filename_pattern.replace("{index}", str(i + 1))
-            
-            # Replace any column placeholders in filename
             row_data = self.csv_handler.get_row_data(i)
-            for name, value in row_data.items():
-                # Sanitize value for filename
-                safe_value = "".join(c for c in str(value) if c.isalnum() or c in "._- ")
-                filename = filename.replace(f"{{{name}}}", safe_value)
-            
-            output_path = os.path.join(output_dir, filename)
+            output_path = self._output_path(
+                output_dir, filename_pattern, pattern_columns, i, row_data
+            )
             
             # Generate the PDF
-            self.generate_single(i, output_path)
+            _render_row(src_bytes, prepared, i, row_data, output_path)
             generated_files.append(output_path)
             
             # Report progress
@@ -161,21 +310,202 @@ class PDFGenerator:
         
         return generated_files
     
-    def merge_pdfs(self, pdf_files: list[str], output_path: str) -> None:
+    def generate_batch_merged(
+        self,
+        output_path: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        start_row: int = 0,
+        end_row: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> int:
         """
-        Merge multiple PDFs into a single file.
+        Render a range of rows straight into one merged PDF.
+        
+        Rows are appended to the merged document in memory, so no per-row
+        files are written and read back.
         
         Args:
-            pdf_files: List of PDF file paths to merge
             output_path: Path for the merged output PDF
+            progress_callback: Function called with (current, total) for progress updates
+            start_row: First row to process (0-indexed)
+            end_row: Last row to process (exclusive), None for all rows
+            max_workers: Maximum number of worker processes; None or 1 renders
+                         sequentially. Small batches always render sequentially,
+                         and at most one worker is started per ROWS_PER_WORKER rows.
+        
+        Returns:
+            Number of rows merged; nothing is written when the range is empty
         """
+        start, end = self._row_range(start_row, end_row)
+        count = end - start
+        if count <= 0:
+            return 0
+        
+        workers = _pool_workers(max_workers, count)
         merged_doc = fitz.open()
+        try:
+            if workers > 1:
+                placeholder_dicts = self.placeholder_manager.to_list()
+                tasks = [
+                    (self.pdf_path, placeholder_dicts, i, self.csv_handler.get_row_data(i))
+                    for i in range(start, end)
+                ]
+                with ProcessPoolExecutor(
+                    max_workers=workers, mp_context=_POOL_CONTEXT
+                ) as executor:
+                    # map() yields in row order, which is the merge order
+                    for done, data in enumerate(
+                        executor.map(render_row_bytes, tasks, chunksize=4), start=1
+                    ):
+                        row_doc = fitz.open("pdf", data)
+                        merged_doc.insert_pdf(row_doc)
+                        row_doc.close()
+                        if progress_callback:
+                            progress_callback(done, count)
+            else:
+                src_bytes = self._source_bytes()
+                prepared = _prepare_placeholders(self.placeholder_manager.placeholders)
+                for done, i in enumerate(range(start, end), start=1):
+                    row_data = self.csv_handler.get_row_data(i)
+                    row_doc = _build_row_doc(src_bytes, prepared, i, row_data)
+                    merged_doc.insert_pdf(row_doc)
+                    row_doc.close()
+                    if progress_callback:
+                        progress_callback(done, count)
+            
+            merged_doc.save(output_path)
+        finally:
+            merged_doc.close()
         
-        for pdf_path in pdf_files:
-            doc = fitz.open(pdf_path)
-            merged_doc.insert_pdf(doc)
-            doc.close()
+        return count
+    
+    def _row_range(self, start_row: int, end_row: Optional[int]) -> tuple[int, int]:
+        """Clamp a requested row range to the loaded CSV rows."""
+        total_rows = self.csv_handler.get_row_count()
+        start = max(0, min(start_row, total_rows))
+        end = total_rows if end_row is None else min(end_row, total_rows)
+        return start, end
+    
+    @staticmethod
+    def _pattern_columns(filename_pattern: str) -> list[str]:
+        """Return the distinct column names referenced as {name} in a filename pattern."""
+        names = dict.fromkeys(_PATTERN_TOKEN.findall(filename_pattern))
+        names.pop("index", None)
+        return list(names)
+    
+    def _output_path(
+        self,
+        output_dir: str,
+        filename_pattern: str,
+        pattern_columns: list[str],
+        row_index: int,
+        row_data: dict[str, str]
+    ) -> str:
+        """Build the output file path for a row from the filename pattern."""
+        # Sanitized values for the column tokens used in the filename
+        subs = {
+            name: _UNSAFE_FILENAME_CHARS.sub("", str(row_data[name]))
+            for name in pattern_columns
+            if name in row_data
+        }
+        subs["index"] = str(row_index + 1)
         
-        merged_doc.save(output_path)
-        merged_doc.close()
-
+        # Replace every token in one pass; unknown tokens are left as-is
+        filename = _PATTERN_TOKEN.sub(
+            lambda match: subs.get(match.group(1), match.group(0)), filename_pattern
+        )
+        
+        return os.path.join(output_dir, filename)
+    
+    def _generate_batch_parallel(
+        self,
+        output_dir: str,
+        filename_pattern: str,
+        pattern_columns: list[str],
+        progress_callback: Optional[Callable[[int, int], None]],
+        start: int,
+        end: int,
+        max_workers: int
+    ) -> list[str]:
+        """Render rows in a process pool, returning paths in row order."""
+        placeholder_dicts = self.placeholder_manager.to_list()
+        output_paths = []
+        tasks = {}  # output path -> task of the last row writing it
+        for i in range(start, end):
+            row_data = self.csv_handler.get_row_data(i)
+            output_path = self._output_path(
+                output_dir, filename_pattern, pattern_columns, i, row_data
+            )
+            output_paths.append(output_path)
+            # Rows sharing a filename would race; the last row wins, as it
+            # does when rendering sequentially
+            tasks[output_path] = (self.pdf_path, placeholder_dicts, i, row_data, output_path)
+        # Progress counts the files actually written, after the dedupe above
+        count = len(tasks)
+        
+        with ProcessPoolExecutor(
+            max_workers=max(1, min(max_workers, math.ceil(count / ROWS_PER_WORKER))),
+            mp_context=_POOL_CONTEXT
+        ) as executor:
+            futures = [executor.submit(render_one_row, task) for task in tasks.values()]
+            for done, future in enumerate(as_completed(futures), start=1):
+                # Re-raise any worker error
+                future.result()
+                if progress_callback:
+                    progress_callback(done, count)
+        
+        return output_paths
+    
+    def generate_batch_async(
+        self,
+        output_dir: str,
+        filename_pattern: str = "output_{index}.pdf",
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        start_row: int = 0,
+        end_row: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        merged_path: Optional[str] = None,
+        on_done: Optional[Callable[[int, Optional[Exception]], None]] = None
+    ) -> threading.Thread:
+        """
+        Generate PDFs on a background thread.
+        
+        Both callbacks run on the worker thread, so GUI callers must hand them
+        over to their own event loop.
+        
+        Args:
+            output_dir: Directory to save generated PDFs (unused when merging)
+            filename_pattern: Pattern for output filenames, as in generate_batch
+            progress_callback: Function called with (current, total) for progress updates
+            start_row: First row to process (0-indexed)
+            end_row: Last row to process (exclusive), None for all rows
+            max_workers: Number of worker processes, as in generate_batch
+            merged_path: If set, render all rows into this single merged PDF instead
+            on_done: Called with (number of rows generated, None) on success,
+                     or (0, the exception that stopped generation)
+        
+        Returns:
+            The started worker thread
+        """
+        def worker():
+            try:
+                if merged_path is not None:
+                    count = self.generate_batch_merged(
+                        merged_path, progress_callback, start_row, end_row, max_workers
+                    )
+                else:
+                    count = len(self.generate_batch(
+                        output_dir, filename_pattern, progress_callback,
+                        start_row, end_row, max_workers
+                    ))
+            except Exception as e:
+                if on_done:
+                    on_done(0, e)
+                return
+            
+            if on_done:
+                on_done(count, None)
+        
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        return thread
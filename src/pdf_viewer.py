@@ -1,11 +1,33 @@
 """PDF Viewer component for displaying and interacting with PDF pages."""
 
 import fitz  # PyMuPDF
-from PIL import Image, ImageTk
 import tkinter as tk
+from collections import OrderedDict
 from tkinter import Canvas
+from tkinter import font as tkfont
 from typing import Callable, Optional
-from .placeholder import Placeholder, PlaceholderManager
+from .placeholder import Placeholder, PlaceholderManager, color_to_hex
+
+# Rendered page images kept for reuse, keyed by (page, zoom)
+PAGE_CACHE_SIZE = 8
+
+# At or above this zoom only the visible part of the page is rasterized, in
+# square tiles of TILE_SIZE pixels cached by (page, zoom, column, row)
+TILED_MIN_ZOOM = 2.0
+TILE_SIZE = 512
+TILE_CACHE_SIZE = 48
+
+# Idle delay before the pages next to the current one are rasterized ahead
+PREFETCH_DELAY_MS = 150
+
+# Quiet period after a zoom click before the page is re-rendered
+ZOOM_RENDER_DELAY_MS = 80
+
+# Measured marker label sizes kept before the table is reset
+TEXT_EXTENT_CACHE_SIZE = 1024
+
+# Share of MuPDF's resource store released on each page turn
+STORE_TRIM_PERCENT = 50
 
 
 class PDFViewer:
@@ -40,8 +62,38 @@ class PDFViewer:
         self.doc: Optional[fitz.Document] = None
         self.current_page = 0
         self.zoom = 1.0
-        self.page_image: Optional[ImageTk.PhotoImage] = None
-        self.placeholder_items: dict[int, Placeholder] = {}
+        self.page_image: Optional[tk.PhotoImage] = None
+        self._page_cache: OrderedDict[tuple[int, float], tk.PhotoImage] = OrderedDict()
+        self._tile_cache: OrderedDict[tuple[int, float, int, int], tk.PhotoImage] = (
+            OrderedDict()
+        )
+        self._tiles_on_canvas: set[tuple[int, int]] = set()
+        self._tiled = False
+        self._pix_width = 0
+        self._pix_height = 0
+        self._tile_update_id: Optional[str] = None
+        # Canvas item showing the whole page in untiled mode, reused across renders
+        self._page_item: Optional[int] = None
+        # (page, zoom, canvas width, canvas height) of the last full render
+        self._render_sig: Optional[tuple[int, float, int, int]] = None
+        self._prefetch_id: Optional[str] = None
+        self._zoom_after_id: Optional[str] = None
+        # Zoom the canvas currently shows; self.zoom runs ahead of it while a
+        # zoom render is pending
+        self._rendered_zoom = self.zoom
+        # id(placeholder) -> (placeholder, x0, y0, x1, y1) of its marker box,
+        # in drawing order so later entries are on top
+        self._placeholder_rects: dict[
+            int, tuple[Placeholder, float, float, float, float]
+        ] = {}
+        # Preview fonts by size, and measured (width, height) by (size, text)
+        self._font_cache: dict[int, tkfont.Font] = {}
+        self._text_extents: dict[tuple[int, str], tuple[int, int]] = {}
+        self._matrix_cache: dict[float, fitz.Matrix] = {}
+        # id(placeholder) -> canvas items drawn for it, moved together on drag
+        self._placeholder_canvas_items: dict[int, list[int]] = {}
+        # id(placeholder) -> (drawn state, marker box) of the last marker update
+        self._marker_states: dict[int, tuple[tuple, tuple]] = {}
         self.selected_placeholder: Optional[Placeholder] = None
 
         # Drag state - track the initial PDF position, not canvas position
@@ -50,6 +102,9 @@ class PDFViewer:
         self.drag_initial_pdf_y = 0
         self.drag_start_canvas_x = 0
         self.drag_start_canvas_y = 0
+        # Latest pointer position, applied once per idle pass
+        self._pending_drag: Optional[tuple[float, float]] = None
+        self._drag_after_id: Optional[str] = None
 
         # Create main frame
         self.frame = tk.Frame(parent, bg="#2b2b2b")
@@ -69,8 +124,8 @@ class PDFViewer:
             yscrollcommand=self.v_scroll.set,
         )
 
-        self.v_scroll.config(command=self.canvas.yview)
-        self.h_scroll.config(command=self.canvas.xview)
+        self.v_scroll.config(command=self._on_yscroll)
+        self.h_scroll.config(command=self._on_xscroll)
 
         # Grid layout for canvas and scrollbars
         self.canvas.grid(row=0, column=0, sticky="nsew")
@@ -140,6 +195,7 @@ class PDFViewer:
         self.canvas.bind("<Button-1>", self._on_canvas_click)
         self.canvas.bind("<B1-Motion>", self._on_drag)
         self.canvas.bind("<ButtonRelease-1>", self._on_drag_end)
+        self.canvas.bind("<Configure>", self._schedule_tile_update)
 
         # Store page offset for coordinate calculation
         self.page_offset_x = 0
@@ -159,8 +215,15 @@ class PDFViewer:
         """Load a PDF file."""
         if self.doc:
             self.doc.close()
+            # Drop MuPDF's cached resources for the old document
+            fitz.TOOLS.store_shrink(100)
 
+        self._cancel_prefetch()
         self.doc = fitz.open(path)
+        self._render_sig = None
+        self._page_cache.clear()
+        self._tile_cache.clear()
+        self._text_extents.clear()
         self.current_page = 0
         self.selected_placeholder = None
         self._render_page()
@@ -170,48 +233,78 @@ class PDFViewer:
         if not self.doc or self.current_page >= len(self.doc):
             return
 
+        canvas_width = self.canvas.winfo_width() or 800
+        canvas_height = self.canvas.winfo_height() or 600
+
+        # With the same page, zoom and canvas size only the markers can differ
+        render_sig = (self.current_page, self.zoom, canvas_width, canvas_height)
+        if render_sig == self._render_sig:
+            self._draw_placeholders()
+            return
+
         page = self.doc[self.current_page]
 
         # Store original page dimensions
         self.page_width = page.rect.width
         self.page_height = page.rect.height
 
-        # Create pixmap with zoom
-        mat = fitz.Matrix(self.zoom, self.zoom)
-        pix = page.get_pixmap(matrix=mat)
+        mat = self._zoom_matrix()
+        self._tiled = self.zoom >= TILED_MIN_ZOOM
 
-        # Convert to PIL Image
-        img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
-        self.page_image = ImageTk.PhotoImage(img)
+        if self._tiled:
+            # Tiles are drawn after the page geometry is known
+            image = None
+            page_rect = (page.rect * mat).irect
+            pix_width = page_rect.width
+            pix_height = page_rect.height
+        else:
+            image = self._get_page_image(self.current_page)
+            pix_width = image.width()
+            pix_height = image.height()
 
-        # Clear canvas and draw page
-        self.canvas.delete("all")
+        self.page_image = image
+        self._pix_width = pix_width
+        self._pix_height = pix_height
 
-        # Center the page on canvas
-        canvas_width = self.canvas.winfo_width() or 800
-        canvas_height = self.canvas.winfo_height() or 600
+        # Drop any tiles; the page item and placeholder items are updated in place
+        self.canvas.delete("tile")
+        self._tiles_on_canvas.clear()
 
-        self.page_offset_x = max(20, (canvas_width - pix.width) // 2)
+        # Center the page on canvas
+        self.page_offset_x = max(20, (canvas_width - pix_width) // 2)
         self.page_offset_y = 20
-
-        self.canvas.create_image(
-            self.page_offset_x,
-            self.page_offset_y,
-            anchor=tk.NW,
-            image=self.page_image,
-            tags="page",
-        )
+        self._rendered_zoom = self.zoom
+
+        if image is None:
+            if self._page_item is not None:
+                self.canvas.delete(self._page_item)
+                self._page_item = None
+        elif self._page_item is not None:
+            self.canvas.itemconfigure(self._page_item, image=image)
+            self.canvas.coords(self._page_item, self.page_offset_x, self.page_offset_y)
+        else:
+            self._page_item = self.canvas.create_image(
+                self.page_offset_x,
+                self.page_offset_y,
+                anchor=tk.NW,
+                image=image,
+                tags="page",
+            )
+            self.canvas.tag_lower("page")
 
         # Update scroll region
         self.canvas.config(
             scrollregion=(
                 0,
                 0,
-                max(canvas_width, pix.width + 40),
-                max(canvas_height, pix.height + 40),
+                max(canvas_width, pix_width + 40),
+                max(canvas_height, pix_height + 40),
             )
         )
 
+        if self._tiled:
+            self._draw_visible_tiles()
+
         # Draw placeholders
         self._draw_placeholders()
 
@@ -219,92 +312,295 @@ class PDFViewer:
         self.page_label.config(text=f"Page {self.current_page + 1} / {len(self.doc)}")
         self.zoom_label.config(text=f"{int(self.zoom * 100)}%")
 
+        self._render_sig = render_sig
+        self._schedule_prefetch()
+
+    def _zoom_matrix(self) -> fitz.Matrix:
+        """Return the scaling matrix for the current zoom level."""
+        mat = self._matrix_cache.get(self.zoom)
+        if mat is None:
+            mat = self._matrix_cache[self.zoom] = fitz.Matrix(self.zoom, self.zoom)
+        return mat
+
+    def _get_page_image(self, page_index: int) -> tk.PhotoImage:
+        """Return the rasterized page at the current zoom, using the cache."""
+        # Reuse the rasterized page when it is cached at this zoom
+        key = (page_index, round(self.zoom, 3))
+        image = self._page_cache.get(key)
+        if image is not None:
+            self._page_cache.move_to_end(key)
+            return image
+
+        # Create pixmap with zoom
+        mat = self._zoom_matrix()
+        pix = self.doc[page_index].get_pixmap(
+            matrix=mat, colorspace=fitz.csRGB, alpha=False
+        )
+
+        # Tk decodes PPM natively, so no intermediate image object is needed;
+        # free the pixmap before Tk makes its own copy to keep peak memory down
+        data = pix.tobytes("ppm")
+        del pix
+        image = tk.PhotoImage(data=data)
+        del data
+
+        self._page_cache[key] = image
+        if len(self._page_cache) > PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+        return image
+
+    def _schedule_prefetch(self) -> None:
+        """Rasterize the neighbouring pages once the UI has been idle briefly."""
+        self._cancel_prefetch()
+        if not self._tiled:
+            self._prefetch_id = self.canvas.after(
+                PREFETCH_DELAY_MS, self._prefetch_neighbours
+            )
+
+    def _cancel_prefetch(self) -> None:
+        """Drop a pending neighbour prefetch."""
+        if self._prefetch_id is not None:
+            self.canvas.after_cancel(self._prefetch_id)
+            self._prefetch_id = None
+
+    def _prefetch_neighbours(self) -> None:
+        """Cache the next uncached neighbouring page, one page per idle slot."""
+        self._prefetch_id = None
+        if not self.doc or self._tiled:
+            return
+
+        zoom_key = round(self.zoom, 3)
+        for page_index in (self.current_page + 1, self.current_page - 1):
+            if not 0 <= page_index < len(self.doc):
+                continue
+            if (page_index, zoom_key) in self._page_cache:
+                continue
+
+            # Insert without promoting the neighbour over the visible page,
+            # which may not be cached at this zoom yet
+            self._get_page_image(page_index)
+            current_key = (self.current_page, zoom_key)
+            if current_key in self._page_cache:
+                self._page_cache.move_to_end(current_key)
+            self._prefetch_id = self.canvas.after_idle(self._prefetch_neighbours)
+            return
+
+    def _draw_visible_tiles(self) -> None:
+        """Rasterize and place the page tiles that intersect the viewport."""
+        if not self._tiled or not self.doc:
+            return
+
+        # Visible canvas area, relative to the page's top-left corner
+        left = self.canvas.canvasx(0) - self.page_offset_x
+        top = self.canvas.canvasy(0) - self.page_offset_y
+        right = left + self.canvas.winfo_width()
+        bottom = top + self.canvas.winfo_height()
+
+        first_col = max(0, int(left // TILE_SIZE))
+        first_row = max(0, int(top // TILE_SIZE))
+        last_col = min(int(right // TILE_SIZE), (self._pix_width - 1) // TILE_SIZE)
+        last_row = min(int(bottom // TILE_SIZE), (self._pix_height - 1) // TILE_SIZE)
+
+        page = self.doc[self.current_page]
+        mat = self._zoom_matrix()
+        zoom_key = round(self.zoom, 3)
+
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                if (col, row) in self._tiles_on_canvas:
+                    continue
+
+                key = (self.current_page, zoom_key, col, row)
+                image = self._tile_cache.get(key)
+                if image is not None:
+                    self._tile_cache.move_to_end(key)
+                else:
+                    # Clip is in page units; MuPDF renders just that region
+                    clip = fitz.Rect(
+                        col * TILE_SIZE,
+                        row * TILE_SIZE,
+                        (col + 1) * TILE_SIZE,
+                        (row + 1) * TILE_SIZE,
+                    ) / self.zoom
+                    pix = page.get_pixmap(
+                        matrix=mat, clip=clip, colorspace=fitz.csRGB, alpha=False
+                    )
+                    data = pix.tobytes("ppm")
+                    del pix
+                    image = tk.PhotoImage(data=data)
+                    del data
+
+                    self._tile_cache[key] = image
+                    if len(self._tile_cache) > TILE_CACHE_SIZE:
+                        self._tile_cache.popitem(last=False)
+
+                self.canvas.create_image(
+                    self.page_offset_x + col * TILE_SIZE,
+                    self.page_offset_y + row * TILE_SIZE,
+                    anchor=tk.NW,
+                    image=image,
+                    tags=("page", "tile"),
+                )
+                self._tiles_on_canvas.add((col, row))
+
+        # Keep tiles below the placeholder markers
+        self.canvas.tag_lower("page")
+
+    def _schedule_tile_update(self, event: Optional[tk.Event] = None) -> None:
+        """Fetch newly exposed tiles once Tk is idle."""
+        if self._tiled and self._tile_update_id is None:
+            self._tile_update_id = self.canvas.after_idle(self._run_tile_update)
+
+    def _run_tile_update(self) -> None:
+        """Draw tiles for the current viewport."""
+        self._tile_update_id = None
+        self._draw_visible_tiles()
+
+    def _on_xscroll(self, *args) -> None:
+        """Scroll horizontally and fill in newly visible tiles."""
+        self.canvas.xview(*args)
+        self._schedule_tile_update()
+
+    def _on_yscroll(self, *args) -> None:
+        """Scroll vertically and fill in newly visible tiles."""
+        self.canvas.yview(*args)
+        self._schedule_tile_update()
+
     def _draw_placeholders(self) -> None:
         """Draw placeholder markers with accurate positioning preview."""
-        self.placeholder_items.clear()
-
         placeholders = self.placeholder_manager.get_for_page(self.current_page)
+        visible = {id(p) for p in placeholders}
+
+        # Drop the items of placeholders removed or not on this page
+        for key in list(self._placeholder_canvas_items):
+            if key not in visible:
+                self.canvas.delete(*self._placeholder_canvas_items.pop(key))
+                self._marker_states.pop(key, None)
+        self._placeholder_rects.clear()
 
         for p in placeholders:
-            # Convert PDF coordinates to canvas coordinates
-            canvas_x = self.page_offset_x + (p.x * self.zoom)
-            canvas_y = self.page_offset_y + (p.y * self.zoom)
-
-            # Calculate preview font size (scaled by zoom)
-            # PDF points are smaller than Tkinter pixels, apply 0.75 correction factor
-            preview_size = max(6, int(p.font_size * self.zoom * 0.75))
-
-            # Convert color
-            if any(c > 1 for c in p.font_color):
-                color = f"#{int(p.font_color[0]):02x}{int(p.font_color[1]):02x}{int(p.font_color[2]):02x}"
-            else:
-                color = f"#{int(p.font_color[0] * 255):02x}{int(p.font_color[1] * 255):02x}{int(p.font_color[2] * 255):02x}"
-
-            display_text = p.get_display_name()
-
-            # Check if selected
-            is_selected = p == self.selected_placeholder
-            outline_color = "#ffff00" if is_selected else "#4a9eff"
-            outline_width = 3 if is_selected else 2
-
-            # Create text - NO BOLD, use regular font to match PDF output
-            text_id = self.canvas.create_text(
-                canvas_x,
-                canvas_y,
-                text=display_text,
-                anchor=tk.SW,  # Bottom-left to match PDF baseline positioning
-                fill=color,
-                font=("Helvetica", preview_size),  # Removed "bold"
-                tags=("placeholder", f"ph_{p.name}"),
-            )
+            item_ids = self._placeholder_canvas_items.get(id(p))
+            if item_ids is None:
+                item_ids = self._create_placeholder_items()
+                self._placeholder_canvas_items[id(p)] = item_ids
+            self._update_placeholder_items(p, item_ids)
 
-            # Get text bounds for background
-            bbox = self.canvas.bbox(text_id)
-            if bbox:
-                # Selection/highlight box
-                bg_id = self.canvas.create_rectangle(
-                    bbox[0] - 3,
-                    bbox[1] - 2,
-                    bbox[2] + 3,
-                    bbox[3] + 2,
-                    fill="#4a9eff" if is_selected else "",
-                    stipple="gray50" if is_selected else "",
-                    outline=outline_color,
-                    width=outline_width,
-                    tags=("placeholder_bg", f"ph_{p.name}"),
-                )
-                self.canvas.tag_raise(text_id, bg_id)
-                self.placeholder_items[bg_id] = p
-
-            self.placeholder_items[text_id] = p
-
-            # Draw a small crosshair at the exact anchor point for accuracy
-            cross_size = 4
-            self.canvas.create_line(
-                canvas_x - cross_size,
-                canvas_y,
-                canvas_x + cross_size,
-                canvas_y,
-                fill="#ff6b6b",
-                width=1,
-                tags=("crosshair", f"ph_{p.name}"),
-            )
-            self.canvas.create_line(
-                canvas_x,
-                canvas_y - cross_size,
-                canvas_x,
-                canvas_y + cross_size,
-                fill="#ff6b6b",
-                width=1,
-                tags=("crosshair", f"ph_{p.name}"),
+    def _create_placeholder_items(self) -> list[int]:
+        """Create the canvas items for one placeholder marker.
+
+        Returns:
+            Item ids as [text, background, horizontal cross, vertical cross]
+        """
+        # Background first so the text stays above it
+        bg_id = self.canvas.create_rectangle(0, 0, 0, 0)
+        # Bottom-left anchor to match PDF baseline positioning
+        text_id = self.canvas.create_text(0, 0, anchor=tk.SW)
+        h_id = self.canvas.create_line(0, 0, 0, 0, fill="#ff6b6b", width=1)
+        v_id = self.canvas.create_line(0, 0, 0, 0, fill="#ff6b6b", width=1)
+        return [text_id, bg_id, h_id, v_id]
+
+    def _update_placeholder_items(self, p: Placeholder, item_ids: list[int]) -> None:
+        """Position and style an existing placeholder marker."""
+        text_id, bg_id, h_id, v_id = item_ids
+        # Shared by all items of this marker so a drag moves them in one call
+        marker_tag = f"marker_{text_id}"
+
+        # Convert PDF coordinates to canvas coordinates
+        canvas_x = self.page_offset_x + (p.x * self.zoom)
+        canvas_y = self.page_offset_y + (p.y * self.zoom)
+
+        # Calculate preview font size (scaled by zoom)
+        # PDF points are smaller than Tkinter pixels, apply 0.75 correction factor
+        preview_size = max(6, int(p.font_size * self.zoom * 0.75))
+
+        # Check if selected
+        is_selected = p == self.selected_placeholder
+
+        # Skip the Tk calls when the marker already looks like this
+        display_text = p.get_display_name()
+        state = (
+            canvas_x,
+            canvas_y,
+            display_text,
+            p.font_color,
+            preview_size,
+            is_selected,
+            p.name,
+        )
+        drawn = self._marker_states.get(id(p))
+        if drawn is not None and drawn[0] == state:
+            self._placeholder_rects[id(p)] = (p, *drawn[1])
+            return
+
+        outline_color = "#ffff00" if is_selected else "#4a9eff"
+        outline_width = 3 if is_selected else 2
+
+        # Text - NO BOLD, use regular font to match PDF output
+        self.canvas.coords(text_id, canvas_x, canvas_y)
+        self.canvas.itemconfig(
+            text_id,
+            text=display_text,
+            fill=color_to_hex(p.font_color),
+            font=self._preview_font(preview_size),
+            tags=("placeholder", f"ph_{p.name}", marker_tag),
+        )
+
+        # Selection/highlight box around the text bounds, measured in Python
+        # rather than asking the canvas for the item's bbox
+        width, height = self._text_extent(display_text, preview_size)
+        rect = (canvas_x - 3, canvas_y - height - 2, canvas_x + width + 3, canvas_y + 2)
+        self.canvas.coords(bg_id, *rect)
+        self._placeholder_rects[id(p)] = (p, *rect)
+        self._marker_states[id(p)] = (state, rect)
+        self.canvas.itemconfig(
+            bg_id,
+            fill="#4a9eff" if is_selected else "",
+            stipple="gray50" if is_selected else "",
+            outline=outline_color,
+            width=outline_width,
+            tags=("placeholder_bg", f"ph_{p.name}", marker_tag),
+        )
+
+        # Small crosshair at the exact anchor point for accuracy
+        cross_size = 4
+        self.canvas.coords(
+            h_id, canvas_x - cross_size, canvas_y, canvas_x + cross_size, canvas_y
+        )
+        self.canvas.coords(
+            v_id, canvas_x, canvas_y - cross_size, canvas_x, canvas_y + cross_size
+        )
+        for line_id in (h_id, v_id):
+            self.canvas.itemconfig(
+                line_id, tags=("crosshair", f"ph_{p.name}", marker_tag)
             )
 
+    def _preview_font(self, size: int) -> tkfont.Font:
+        """Return the shared marker font for a preview size."""
+        font = self._font_cache.get(size)
+        if font is None:
+            font = tkfont.Font(root=self.canvas, family="Helvetica", size=size)
+            self._font_cache[size] = font
+        return font
+
+    def _text_extent(self, text: str, size: int) -> tuple[int, int]:
+        """Return the (width, height) of marker text at a preview size."""
+        key = (size, text)
+        extent = self._text_extents.get(key)
+        if extent is None:
+            font = self._preview_font(size)
+            extent = (font.measure(text), font.metrics("linespace"))
+            # Every zoom level measures at new sizes; don't let them pile up
+            if len(self._text_extents) >= TEXT_EXTENT_CACHE_SIZE:
+                self._text_extents.clear()
+            self._text_extents[key] = extent
+        return extent
+
     def _find_placeholder_at(self, x: float, y: float) -> Optional[Placeholder]:
         """Find placeholder at canvas coordinates."""
-        items = self.canvas.find_overlapping(x - 5, y - 5, x + 5, y + 5)
-        for item_id in reversed(items):  # Check top items first
-            if item_id in self.placeholder_items:
-                return self.placeholder_items[item_id]
+        # Check top items first
+        for p, x0, y0, x1, y1 in reversed(self._placeholder_rects.values()):
+            if x0 - 5 <= x <= x1 + 5 and y0 - 5 <= y <= y1 + 5:
+                return p
         return None
 
     def _on_canvas_click(self, event: tk.Event) -> None:
@@ -338,15 +634,16 @@ class PDFViewer:
             if self.on_placeholder_select:
                 self.on_placeholder_select(placeholder)
         else:
+            # Convert to PDF coordinates for new placeholder, using the scale
+            # and offset the user clicked on rather than a pending zoom's
+            pdf_x = (canvas_x - self.page_offset_x) / self._rendered_zoom
+            pdf_y = (canvas_y - self.page_offset_y) / self._rendered_zoom
+
             # Clear selection and drag state
             self.selected_placeholder = None
             self.dragging_placeholder = None
             self._render_page()
 
-            # Convert to PDF coordinates for new placeholder
-            pdf_x = (canvas_x - self.page_offset_x) / self.zoom
-            pdf_y = (canvas_y - self.page_offset_y) / self.zoom
-
             # Check if within page bounds
             if 0 <= pdf_x <= self.page_width and 0 <= pdf_y <= self.page_height:
                 if self.on_click:
@@ -357,8 +654,21 @@ class PDFViewer:
         if not self.dragging_placeholder:
             return
 
-        canvas_x = self.canvas.canvasx(event.x)
-        canvas_y = self.canvas.canvasy(event.y)
+        # Coalesce motion events; only the newest position is applied
+        self._pending_drag = (
+            self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
+        )
+        if self._drag_after_id is None:
+            self._drag_after_id = self.canvas.after_idle(self._apply_drag)
+
+    def _apply_drag(self) -> None:
+        """Move the dragged placeholder to the latest pointer position."""
+        self._drag_after_id = None
+        if not self.dragging_placeholder or self._pending_drag is None:
+            return
+
+        canvas_x, canvas_y = self._pending_drag
+        self._pending_drag = None
 
         # Calculate delta from the original start position
         delta_canvas_x = canvas_x - self.drag_start_canvas_x
@@ -376,18 +686,37 @@ class PDFViewer:
         new_pdf_x = max(0, min(new_pdf_x, self.page_width))
         new_pdf_y = max(0, min(new_pdf_y, self.page_height))
 
-        # Update placeholder position directly
-        self.dragging_placeholder.x = new_pdf_x
-        self.dragging_placeholder.y = new_pdf_y
+        # Shift the placeholder's own canvas items; the page itself is unchanged
+        placeholder = self.dragging_placeholder
+        move_x = (new_pdf_x - placeholder.x) * self.zoom
+        move_y = (new_pdf_y - placeholder.y) * self.zoom
+        item_ids = self._placeholder_canvas_items.get(id(placeholder))
+        if item_ids:
+            self.canvas.move(f"marker_{item_ids[0]}", move_x, move_y)
+        rect = self._placeholder_rects.get(id(placeholder))
+        if rect:
+            p, x0, y0, x1, y1 = rect
+            self._placeholder_rects[id(placeholder)] = (
+                p, x0 + move_x, y0 + move_y, x1 + move_x, y1 + move_y
+            )
+        # The cached state describes the pre-drag geometry; force the next
+        # redraw to reposition the items even if it matches that state again
+        self._marker_states.pop(id(placeholder), None)
 
-        # Redraw to show new position
-        self._render_page()
+        # Update placeholder position directly
+        placeholder.x = new_pdf_x
+        placeholder.y = new_pdf_y
 
     def _on_drag_end(self, event: tk.Event) -> None:
         """Handle end of drag."""
         if not self.dragging_placeholder:
             return
 
+        # Apply a motion event still waiting for the idle pass
+        if self._drag_after_id is not None:
+            self.canvas.after_cancel(self._drag_after_id)
+            self._apply_drag()
+
         # Notify callback of final position
         if self.on_placeholder_move:
             self.on_placeholder_move(
@@ -418,6 +747,7 @@ class PDFViewer:
         if self.doc and self.current_page > 0:
             self.current_page -= 1
             self.selected_placeholder = None
+            fitz.TOOLS.store_shrink(STORE_TRIM_PERCENT)
             self._render_page()
 
     def next_page(self) -> None:
@@ -425,19 +755,36 @@ class PDFViewer:
         if self.doc and self.current_page < len(self.doc) - 1:
             self.current_page += 1
             self.selected_placeholder = None
+            fitz.TOOLS.store_shrink(STORE_TRIM_PERCENT)
             self._render_page()
 
     def zoom_in(self) -> None:
         """Increase zoom level."""
         if self.zoom < 4.0:
             self.zoom += 0.25
-            self._render_page()
+            self._schedule_zoom_render()
 
     def zoom_out(self) -> None:
         """Decrease zoom level."""
         if self.zoom > 0.5:
             self.zoom -= 0.25
-            self._render_page()
+            self._schedule_zoom_render()
+
+    def _schedule_zoom_render(self) -> None:
+        """Show the new zoom level now and render once the clicks settle."""
+        self.zoom_label.config(text=f"{int(self.zoom * 100)}%")
+        # Prefetching at the new zoom would run before the page is rendered
+        self._cancel_prefetch()
+        if self._zoom_after_id is not None:
+            self.canvas.after_cancel(self._zoom_after_id)
+        self._zoom_after_id = self.canvas.after(
+            ZOOM_RENDER_DELAY_MS, self._run_zoom_render
+        )
+
+    def _run_zoom_render(self) -> None:
+        """Render the page at the settled zoom level."""
+        self._zoom_after_id = None
+        self._render_page()
 
     def get_current_page(self) -> int:
         """Get current page number."""
@@ -452,3 +799,10 @@ class PDFViewer:
         if self.doc:
             self.doc.close()
             self.doc = None
+            # Release MuPDF's cached fonts, images and display lists
+            fitz.TOOLS.store_shrink(100)
+        self._cancel_prefetch()
+        self._render_sig = None
+        self._page_cache.clear()
+        self._tile_cache.clear()
+        self._text_extents.clear()
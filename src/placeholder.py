@@ -1,17 +1,54 @@
 """Placeholder data model."""
 
 from dataclasses import dataclass, field, asdict
-from typing import Optional
+from enum import IntEnum
+from functools import lru_cache
+from typing import Optional, Union
 import json
 
 
+class PlaceholderType(IntEnum):
+    """Placeholder types. Saved in templates by their lowercase name."""
+    
+    COLUMN = 0  # Maps to CSV column
+    STATIC = 1  # Static text
+    SERIAL = 2  # Serial number (row index)
+    
+    @property
+    def key(self) -> str:
+        """Return the name used in template files, e.g. "column"."""
+        return self.name.lower()
+    
+    @classmethod
+    def parse(cls, value: Union[str, int]) -> "PlaceholderType":
+        """Convert a template file value (name or number) to a type."""
+        if isinstance(value, str):
+            return cls[value.upper()]
+        return cls(value)
+
+
 # Placeholder types
-PLACEHOLDER_TYPE_COLUMN = "column"  # Maps to CSV column
-PLACEHOLDER_TYPE_STATIC = "static"  # Static text
-PLACEHOLDER_TYPE_SERIAL = "serial"  # Serial number (row index)
+PLACEHOLDER_TYPE_COLUMN = PlaceholderType.COLUMN
+PLACEHOLDER_TYPE_STATIC = PlaceholderType.STATIC
+PLACEHOLDER_TYPE_SERIAL = PlaceholderType.SERIAL
+
+
+@lru_cache(maxsize=256)
+def normalize_color(color: tuple) -> tuple:
+    """Return an RGB color in the 0-1 range, converting from 0-255 if needed."""
+    if any(c > 1 for c in color):
+        return tuple(c / 255 for c in color)
+    return tuple(color)
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def color_to_hex(color: tuple) -> str:
+    """Convert an RGB color (0-1 or 0-255 range) to a #rrggbb string."""
+    r, g, b = normalize_color(color)[:3]
+    return "#" + bytes((round(r * 255), round(g * 255), round(b * 255))).hex()
+
+
+@dataclass(slots=True)
 class Placeholder:
     """Represents a placeholder on a PDF page."""
     
@@ -22,7 +59,7 @@ class Placeholder:
     font_name: str = "helv"  # Default Helvetica
     font_size: float = 12.0
     font_color: tuple = field(default_factory=lambda: (0, 0, 0))  # RGB, 0-1 range
-    placeholder_type: str = PLACEHOLDER_TYPE_COLUMN  # Type of placeholder
+    placeholder_type: PlaceholderType = PLACEHOLDER_TYPE_COLUMN  # Type of placeholder
     static_value: str = ""  # Value for static type
     serial_prefix: str = ""  # Prefix for serial number
     serial_start: int = 1  # Starting number for serial
@@ -35,6 +72,11 @@ class Placeholder:
             return f"#{self.serial_prefix}"
         return f"{{{{{self.name}}}}}"
     
+    @property
+    def color01(self) -> tuple:
+        """Return the font color in the 0-1 range used by PyMuPDF."""
+        return normalize_color(self.font_color)
+    
     def get_value(self, row_index: int, row_data: dict) -> str:
         """Get the value for this placeholder for a given row."""
         if self.placeholder_type == PLACEHOLDER_TYPE_STATIC:
@@ -53,8 +95,8 @@ class Placeholder:
             "y": self.y,
             "font_name": self.font_name,
             "font_size": self.font_size,
-            "font_color": list(self.font_color),
-            "placeholder_type": self.placeholder_type,
+            "font_color": self.font_color,  # JSON encoders write tuples as arrays
+            "placeholder_type": self.placeholder_type.key,
             "static_value": self.static_value,
             "serial_prefix": self.serial_prefix,
             "serial_start": self.serial_start
@@ -63,19 +105,25 @@ class Placeholder:
     @classmethod
     def from_dict(cls, data: dict) -> "Placeholder":
         """Create Placeholder from dictionary."""
-        data = data.copy()
-        if "font_color" in data:
-            data["font_color"] = tuple(data["font_color"])
-        # Handle old format without type fields
-        if "placeholder_type" not in data:
-            data["placeholder_type"] = PLACEHOLDER_TYPE_COLUMN
-        if "static_value" not in data:
-            data["static_value"] = ""
-        if "serial_prefix" not in data:
-            data["serial_prefix"] = ""
-        if "serial_start" not in data:
-            data["serial_start"] = 1
-        return cls(**data)
+        # Older templates have no type fields
+        placeholder_type = data.get("placeholder_type")
+        return cls(
+            name=data["name"],
+            page=data["page"],
+            x=data["x"],
+            y=data["y"],
+            font_name=data.get("font_name", "helv"),
+            font_size=data.get("font_size", 12.0),
+            font_color=tuple(data.get("font_color", (0, 0, 0))),
+            placeholder_type=(
+                PlaceholderType.parse(placeholder_type)
+                if placeholder_type is not None
+                else PLACEHOLDER_TYPE_COLUMN
+            ),
+            static_value=data.get("static_value", ""),
+            serial_prefix=data.get("serial_prefix", ""),
+            serial_start=data.get("serial_start", 1),
+        )
 
 
 class PlaceholderManager:
@@ -83,37 +131,81 @@ class PlaceholderManager:
     
     def __init__(self):
         self.placeholders: list[Placeholder] = []
+        self._index: dict[int, int] = {}  # id(placeholder) -> list index
+        self._names_cache: Optional[list[str]] = None
+        self._pages_cache: Optional[dict[int, list[Placeholder]]] = None  # page -> placeholders
+        self._by_name: Optional[dict[str, Placeholder]] = None  # name -> first placeholder
+    
+    def _rebuild_index(self) -> None:
+        """Recompute the identity-to-index lookup."""
+        self._index = {id(p): i for i, p in enumerate(self.placeholders)}
+    
+    def _drop_caches(self) -> None:
+        """Forget the derived lookups after the list itself changes."""
+        self._names_cache = None
+        self._pages_cache = None
+        self._by_name = None
     
     def add(self, placeholder: Placeholder) -> None:
         """Add a new placeholder."""
+        self._index[id(placeholder)] = len(self.placeholders)
         self.placeholders.append(placeholder)
+        self._drop_caches()
     
     def remove(self, placeholder: Placeholder) -> None:
         """Remove a placeholder."""
-        self.placeholders.remove(placeholder)
+        index = self._index.get(id(placeholder))
+        if index is not None:
+            del self.placeholders[index]
+        else:
+            self.placeholders.remove(placeholder)
+        self._rebuild_index()
+        self._drop_caches()
     
     def remove_by_name(self, name: str) -> None:
         """Remove placeholder by name."""
         self.placeholders = [p for p in self.placeholders if p.name != name]
+        self._rebuild_index()
+        self._drop_caches()
+    
+    def index_of(self, placeholder: Placeholder) -> Optional[int]:
+        """Return the position of a placeholder (by identity), or None."""
+        return self._index.get(id(placeholder))
     
     def get_by_name(self, name: str) -> Optional[Placeholder]:
         """Get placeholder by name."""
-        for p in self.placeholders:
-            if p.name == name:
-                return p
-        return None
+        if self._by_name is None:
+            self._by_name = {}
+            for p in self.placeholders:
+                self._by_name.setdefault(p.name, p)
+        return self._by_name.get(name)
     
     def get_for_page(self, page: int) -> list[Placeholder]:
         """Get all placeholders for a specific page."""
-        return [p for p in self.placeholders if p.page == page]
+        if self._pages_cache is None:
+            self._pages_cache = {}
+            for p in self.placeholders:
+                self._pages_cache.setdefault(p.page, []).append(p)
+        return list(self._pages_cache.get(page, ()))
     
     def get_all_names(self) -> list[str]:
         """Get list of all placeholder names (only for column type)."""
-        return [p.name for p in self.placeholders if p.placeholder_type == PLACEHOLDER_TYPE_COLUMN]
+        if self._names_cache is None:
+            self._names_cache = [
+                p.name for p in self.placeholders if p.placeholder_type == PLACEHOLDER_TYPE_COLUMN
+            ]
+        return self._names_cache.copy()
+    
+    def invalidate_names(self) -> None:
+        """Drop cached names after a placeholder is renamed or changes type."""
+        self._names_cache = None
+        self._by_name = None
     
     def clear(self) -> None:
         """Remove all placeholders."""
         self.placeholders.clear()
+        self._index.clear()
+        self._drop_caches()
     
     def to_list(self) -> list[dict]:
         """Convert all placeholders to list of dictionaries."""
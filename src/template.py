@@ -6,6 +6,11 @@ from pathlib import Path
 from typing import Optional
 from .placeholder import PlaceholderManager
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib json module
+    orjson = None
+
 
 class Template:
     """Represents a PDF template with placeholders."""
@@ -21,13 +26,22 @@ class Template:
             "placeholders": self.placeholder_manager.to_list()
         }
         
+        if orjson is not None:
+            with open(template_path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
+        
         with open(template_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
     
     def load(self, template_path: str) -> None:
         """Load template from JSON file."""
-        with open(template_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(template_path, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(template_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
         
         self.pdf_path = data.get("pdf_path")
         self.placeholder_manager.from_list(data.get("placeholders", []))